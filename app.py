@@ -1,188 +1,365 @@
     def download_from_arxiv(self, selected_papers, dir_path, progress):
-        """直接从arXiv下载论文"""
-        completed = 0
-        
-        for i, paper in enumerate(selected_papers):
-            if progress.wasCanceled():
-                break
-            
-            # 更新进度对话框
-            progress.setValue(i)
-            paper_title = paper.get("title", "论文")
-            progress.setLabelText(f"正在下载 ({i+1}/{len(selected_papers)}): {paper_title}")
-            QApplication.processEvents()
-            
-            # 获取PDF URL
-            pdf_url = paper.get("pdf_url")
+        """直接从arXiv下载论文（在线程池中最多同时下载 MAX_CONCURRENT_DOWNLOADS 篇）"""
+        # 创建下载任务，跳过没有PDF链接和已经下载过的论文
+        self.download_tasks = []
+        already_downloaded = 0
+        for paper in selected_papers:
+            pdf_url = paper.pdf_url
             if not pdf_url:
                 continue
             
-            # 从entry_id提取arxiv ID
-            entry_id = paper.get("entry_id", "")
-            if "/" in entry_id:
-                paper_id = entry_id.split("/")[-1]
-            else:
-                paper_id = entry_id
-            
-            # 创建安全的文件名（只保留部分常见字符）
-            safe_title = "".join(
-                [c if c.isalnum() or c in ['-', '_', '.', ' '] else '_' for c in paper_title]
-            )
-            safe_title = safe_title[:50]  # 限制文件名长度
-            filename = f"{paper_id}_{safe_title}.pdf"
-            filepath = os.path.join(dir_path, filename)
+            filepath = os.path.join(dir_path, paper_descriptor(paper).filename)
+            if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
+                already_downloaded += 1
+                continue
             
-            try:
-                # 发送请求下载PDF
-                request = QNetworkRequest(QUrl(pdf_url))
-                reply = self.network_manager.get(request)
-                
-                # 使用事件循环等待下载完成
-                loop = QTimer()
-                loop.timeout.connect(QApplication.processEvents)
-                loop.start(100)
-                
-                while not reply.isFinished():
-                    QApplication.processEvents()
-                    if progress.wasCanceled():
-                        reply.abort()
-                        break
-                
-                loop.stop()
-                
-                # 保存文件
-                if reply.error() == QNetworkReply.NoError and not progress.wasCanceled():
-                    with open(filepath, "wb") as f:
-                        f.write(reply.readAll().data())
-                    completed += 1
-                
-                reply.deleteLater()
-                
-            except Exception as e:
-                print(f"下载错误: {str(e)}")
+            task = DownloadTask(pdf_url, filepath, paper.title or "论文")
+            task.signals.finished.connect(self.handle_download_finished)
+            self.download_tasks.append(task)
+        
+        # 跳过的论文直接计为已处理，已存在的文件计为下载成功
+        self.download_completed = already_downloaded
+        self.download_pending = len(self.download_tasks)
+        self.download_loop = QEventLoop()
         
-        progress.setValue(len(selected_papers))
+        progress_timer = self.start_progress_updates(progress, len(selected_papers))
+        self.progress_state["done"] = len(selected_papers) - len(self.download_tasks)
         
-        # 显示完成信息
+        progress.canceled.connect(self.cancel_arxiv_downloads)
+        
+        for task in self.download_tasks:
+            self.download_pool.start(task)
+        
+        # 等待所有任务完成（事件循环在最后一个任务结束时退出）
+        if self.download_pending:
+            self.download_loop.exec_()
+        
+        progress.canceled.disconnect(self.cancel_arxiv_downloads)
+        progress_timer.stop()
+        progress_timer.deleteLater()
+        self.download_tasks = []
+        completed = self.download_completed
+        
+        progress.setValue(progress.maximum())
+        
+        # 显示完成信息（非模态，不阻塞后续处理）
         if completed > 0:
-            QMessageBox.information(
-                self, "下载完成", 
+            self.show_notice(
+                QMessageBox.Information, "下载完成", 
                 f"成功下载了 {completed} 篇论文到 {dir_path}"
             )
         else:
-            QMessageBox.warning(
-                self, "下载失败", 
+            self.show_notice(
+                QMessageBox.Warning, "下载失败", 
                 "没有论文被成功下载，请检查网络连接"
             )
         
         self.status_label.setText(f"已下载 {completed} 篇论文")
 
+    def show_notice(self, icon, title, text):
+        """显示非模态提示框，关闭后自动释放"""
+        box = QMessageBox(icon, title, text, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.setWindowModality(Qt.NonModal)
+        box.show()
+
+    def handle_download_finished(self, title, success):
+        """下载线程完成一篇论文时在主线程中调用"""
+        if success:
+            self.download_completed += 1
+        
+        self.download_pending -= 1
+        
+        # 只记录进度，由定时器统一刷新进度对话框
+        self.progress_state["done"] += 1
+        self.progress_state["current"] = title
+        
+        # 全部结束后退出等待循环
+        if self.download_pending == 0:
+            self.download_loop.quit()
+
+    def start_progress_updates(self, progress, total):
+        """
+        启动定时刷新进度对话框的QTimer并返回。
+        下载过程中只修改self.progress_state，对话框每 PROGRESS_UPDATE_INTERVAL 毫秒最多重绘一次。
+        """
+        self.progress_state = {"done": 0, "total": total, "current": ""}
+        
+        # 进度条固定使用千分比刻度，只有刻度变化时才重绘
+        progress.setRange(0, PROGRESS_SCALE)
+        
+        timer = QTimer(self)
+        timer.setInterval(PROGRESS_UPDATE_INTERVAL)
+        timer.timeout.connect(partial(self.refresh_progress, progress))
+        timer.start()
+        return timer
+
+    def refresh_progress(self, progress):
+        """将self.progress_state中的状态刷新到进度对话框（仅在有变化时）"""
+        if progress.wasCanceled():
+            # 取消后对话框已经reset并隐藏，再调用setValue会让它重新显示
+            return
+        
+        state = self.progress_state
+        bucket = state["done"] * PROGRESS_SCALE // max(1, state["total"])
+        if bucket != progress.value():
+            progress.setValue(bucket)
+        
+        label = f"正在下载 ({state['done']}/{state['total']}): {state['current']}"
+        if label != progress.labelText():
+            progress.setLabelText(label)
+
+    def cancel_arxiv_downloads(self):
+        """取消所有排队和进行中的arXiv下载"""
+        for task in self.download_tasks:
+            task.cancel()
+
+    def save_reply(self, reply, filepath):
+        """将已完成的回复内容保存到文件，返回是否成功"""
+        try:
+            write_whole_file(filepath, reply.readAll().data())
+            return True
+        except OSError as e:
+            print(f"下载错误: {str(e)}")
+            return False
+
     def download_via_server(self, selected_papers, dir_path, progress):
         """
-        通过服务器下载选中的论文。
+        通过服务器下载选中的论文（最多同时进行 MAX_CONCURRENT_DOWNLOADS 个请求）。
         如果需要，可在前面 ConfigDialog 或 load_config 方法中配置自己的服务器 URL / 端口 / API Key。
         """
-        completed = 0
+        total = len(selected_papers)
         
-        for i, paper in enumerate(selected_papers):
-            if progress.wasCanceled():
-                break
-            
-            # 从entry_id提取arxiv ID
-            entry_id = paper.get("entry_id", "")
-            if "/" in entry_id:
-                paper_id = entry_id.split("/")[-1]
-            else:
-                paper_id = entry_id
-                
-            paper_title = paper.get("title", "paper")
-            
-            # 更新进度对话框
-            progress.setValue(i)
-            progress.setLabelText(f"正在下载 ({i+1}/{len(selected_papers)}): {paper_title}")
-            QApplication.processEvents()
-            
-            # 准备下载请求
-            request_data = {
-                "paper_id": paper_id,
-                "paper_title": paper_title
-            }
-            
-            json_data = json.dumps(request_data).encode()
-            
-            # 发送请求到服务端 /download 端点
-            # （如果你有自定义下载接口，请在此处修改为对应的路由）
-            reply = self.network_manager.post(self.create_request("/download"), json_data)
-            
-            # 使用“阻塞式”轮询等待本次下载请求完成
-            loop = QTimer()
-            loop.timeout.connect(QApplication.processEvents)
-            loop.start(100)
-            
-            while not reply.isFinished():
-                QApplication.processEvents()
-                if progress.wasCanceled():
-                    reply.abort()
-                    break
-            
-            loop.stop()
-            
-            # 处理响应
-            if reply.error() == QNetworkReply.NoError and not progress.wasCanceled():
-                response_data = json.loads(bytes(reply.readAll()).decode())
-                
-                if response_data.get("success"):
-                    # 获取下载链接
-                    download_link = response_data.get("download_link")
-                    
-                    if download_link:
-                        # 再次向服务器请求 PDF 文件
-                        file_request = self.create_request(download_link)
-                        file_reply = self.network_manager.get(file_request)
-                        
-                        # 等待文件下载完成
-                        loop = QTimer()
-                        loop.timeout.connect(QApplication.processEvents)
-                        loop.start(100)
-                        
-                        while not file_reply.isFinished():
-                            QApplication.processEvents()
-                            if progress.wasCanceled():
-                                file_reply.abort()
-                                break
-                        
-                        loop.stop()
-                        
-                        # 保存文件
-                        if file_reply.error() == QNetworkReply.NoError and not progress.wasCanceled():
-                            filename = download_link.split("/")[-1]
-                            filepath = os.path.join(dir_path, filename)
-                            
-                            with open(filepath, "wb") as f:
-                                f.write(file_reply.readAll().data())
-                            
-                            completed += 1
-                        
-                        file_reply.deleteLater()
-                
-            reply.deleteLater()
+        # 下载前一次性计算所有论文的ID和文件名，倒序存放以便从末尾取出
+        self.server_queue = list(zip(selected_papers, map(paper_descriptor, selected_papers)))[::-1]
+        self.server_replies = set()
+        # 批量请求返回的下载链接（paper_id -> download_link）
+        self.server_links = {}
+        self.server_dir = dir_path
+        self.server_progress = progress
+        self.download_completed = 0
+        self.download_pending = total
+        self.download_loop = QEventLoop()
+        
+        progress_timer = self.start_progress_updates(progress, total)
+        progress.canceled.connect(self.cancel_server_downloads)
         
-        progress.setValue(len(selected_papers))
+        # 先用一次批量请求取得所有下载链接，回复后再开始并发下载
+        self.request_server_batch()
         
-        # 显示完成信息
+        # 等待所有下载完成（事件循环在最后一篇结束时退出）
+        if self.download_pending:
+            self.download_loop.exec_()
+        
+        progress.canceled.disconnect(self.cancel_server_downloads)
+        progress_timer.stop()
+        progress_timer.deleteLater()
+        completed = self.download_completed
+        
+        progress.setValue(progress.maximum())
+        
+        # 显示完成信息（非模态，不阻塞后续处理）
         if completed > 0:
-            QMessageBox.information(
-                self, "下载完成", 
+            self.show_notice(
+                QMessageBox.Information, "下载完成", 
                 f"成功下载了 {completed} 篇论文到 {dir_path}"
             )
         else:
-            QMessageBox.warning(
-                self, "下载失败", 
+            self.show_notice(
+                QMessageBox.Warning, "下载失败", 
                 "没有论文被成功下载，请检查服务器设置和网络连接"
             )
         
         self.status_label.setText(f"已下载 {completed} 篇论文")
 
+    def request_server_batch(self):
+        """向服务器 /download_batch 端点发送一次请求，取得所有排队论文的下载链接"""
+        request_data = {
+            "papers": [
+                {"paper_id": descriptor.paper_id, "paper_title": paper.title or "paper"}
+                for paper, descriptor in reversed(self.server_queue)
+            ]
+        }
+        
+        reply = self.network_manager.post(self.create_request("/download_batch"), json_dumps(request_data))
+        self.server_replies.add(reply)
+        reply.finished.connect(partial(self.handle_server_batch_reply, reply))
+
+    def handle_server_batch_reply(self, reply):
+        """处理/download_batch的回复，然后发出最多 MAX_CONCURRENT_DOWNLOADS 个下载请求"""
+        self.server_replies.discard(reply)
+        reply.deleteLater()
+        
+        response_data = {}
+        if reply.error() == QNetworkReply.NoError:
+            try:
+                response_data = json_loads(bytes(reply.readAll()))
+            except ValueError:
+                pass
+        
+        # 旧版服务器没有该端点（404）或回复格式不符时没有链接，每篇论文仍单独请求/download
+        if response_data.get("success"):
+            self.server_links = {
+                item.get("paper_id"): item.get("download_link")
+                for item in response_data.get("items", [])
+                if item.get("download_link")
+            }
+        
+        # 之后每完成一个再发下一个（已取消时队列为空，不会再发出请求）
+        for _ in range(min(MAX_CONCURRENT_DOWNLOADS, len(self.server_queue))):
+            self.start_next_server_download()
+
+    def start_next_server_download(self):
+        """从队列中取出下一篇论文，向服务器发送下载请求"""
+        if not self.server_queue:
+            return
+        
+        paper, descriptor = self.server_queue.pop()
+        paper_title = paper.title or "paper"
+        
+        # 批量请求已返回下载链接时直接获取PDF
+        download_link = self.server_links.get(descriptor.paper_id)
+        if download_link:
+            self.start_server_file_download(download_link, paper_title)
+            return
+        
+        # 准备下载请求
+        # stream=True请求服务器直接返回PDF内容；旧版服务器会忽略该字段并返回下载链接
+        request_data = {
+            "paper_id": descriptor.paper_id,
+            "paper_title": paper_title,
+            "stream": True
+        }
+        
+        # 发送请求到服务端 /download 端点
+        # （如果你有自定义下载接口，请在此处修改为对应的路由）
+        reply = self.network_manager.post(self.create_request("/download"), json_dumps(request_data))
+        self.server_replies.add(reply)
+        
+        filepath = os.path.join(self.server_dir, descriptor.filename)
+        state = {"file": None}
+        
+        def write_pdf_data():
+            # 服务器直接返回PDF时边接收边写入临时文件；JSON回复留在缓冲区中稍后解析
+            if state["file"] is None:
+                content_type = reply.header(QNetworkRequest.ContentTypeHeader) or ""
+                if not content_type.startswith("application/pdf"):
+                    return
+                try:
+                    state["file"] = open(f"{filepath}.part", "wb", buffering=PDF_WRITE_BUFFER_SIZE)
+                except OSError as e:
+                    print(f"下载错误: {str(e)}")
+                    reply.abort()
+                    return
+            state["file"].write(reply.readAll().data())
+        
+        reply.readyRead.connect(write_pdf_data)
+        reply.finished.connect(
+            lambda: self.handle_server_reply(reply, filepath, paper_title, state["file"])
+        )
+
+    def handle_server_reply(self, reply, filepath, paper_title, partial_file):
+        """处理服务器对/download请求的回复"""
+        self.server_replies.discard(reply)
+        reply.deleteLater()
+        
+        ok = reply.error() == QNetworkReply.NoError and not self.server_progress.wasCanceled()
+        
+        if partial_file is not None:
+            # 服务器已直接返回PDF并写入了临时文件，一次请求完成下载
+            try:
+                success = finish_partial_file(reply, partial_file, filepath, ok)
+            except OSError as e:
+                print(f"下载错误: {str(e)}")
+                success = False
+            self.finish_server_download(paper_title, success)
+            return
+        
+        if not ok:
+            self.finish_server_download(paper_title, False)
+            return
+        
+        content_type = reply.header(QNetworkRequest.ContentTypeHeader) or ""
+        if content_type.startswith("application/pdf"):
+            # 没有触发readyRead（例如空响应体）时一次性保存
+            self.finish_server_download(paper_title, self.save_reply(reply, filepath))
+            return
+        
+        # 获取下载链接，再次向服务器请求 PDF 文件
+        try:
+            response_data = json_loads(bytes(reply.readAll()))
+        except ValueError:
+            response_data = {}
+        download_link = response_data.get("download_link") if response_data.get("success") else None
+        if download_link:
+            self.start_server_file_download(download_link, paper_title)
+        else:
+            self.finish_server_download(paper_title, False)
+
+    def start_server_file_download(self, download_link, paper_title):
+        """按服务器返回的下载链接获取PDF文件"""
+        filename = download_link.split("/")[-1]
+        filepath = os.path.join(self.server_dir, filename)
+        
+        try:
+            # 数据边接收边写入临时文件
+            partial_file = open(f"{filepath}.part", "wb", buffering=PDF_WRITE_BUFFER_SIZE)
+        except OSError as e:
+            print(f"下载错误: {str(e)}")
+            self.finish_server_download(paper_title, False)
+            return
+        
+        file_reply = self.network_manager.get(self.create_request(download_link))
+        self.server_replies.add(file_reply)
+        file_reply.readyRead.connect(lambda: partial_file.write(file_reply.readAll().data()))
+        
+        def handle_file_reply():
+            self.server_replies.discard(file_reply)
+            file_reply.deleteLater()
+            
+            # 保存文件
+            try:
+                success = (file_reply.error() == QNetworkReply.NoError
+                           and not self.server_progress.wasCanceled())
+                success = finish_partial_file(file_reply, partial_file, filepath, success)
+            except OSError as e:
+                print(f"下载错误: {str(e)}")
+                success = False
+            self.finish_server_download(paper_title, success)
+        
+        file_reply.finished.connect(handle_file_reply)
+
+    def finish_server_download(self, paper_title, success):
+        """一篇论文通过服务器下载结束（成功或失败）时调用"""
+        if success:
+            self.download_completed += 1
+        
+        self.download_pending -= 1
+        
+        # 只记录进度，由定时器统一刷新进度对话框
+        self.progress_state["done"] += 1
+        self.progress_state["current"] = paper_title
+        
+        self.start_next_server_download()
+        
+        # 全部结束后退出等待循环
+        if self.download_pending == 0:
+            self.download_loop.quit()
+
+    def cancel_server_downloads(self):
+        """取消所有排队和进行中的服务器下载"""
+        # 排队中的论文直接计为已处理
+        self.download_pending -= len(self.server_queue)
+        self.progress_state["done"] += len(self.server_queue)
+        self.server_queue = []
+        
+        # 中止进行中的请求，它们的finished处理函数会把各自计为失败
+        for reply in list(self.server_replies):
+            reply.abort()
+        
+        if self.download_pending == 0:
+            self.download_loop.quit()
+
     def save_to_csv(self):
         """保存结果为CSV文件"""
         if not self.papers:
@@ -192,47 +369,14 @@
         # 选择保存文件
         file_path, _ = QFileDialog.getSaveFileName(
             self, "保存CSV文件", 
-            os.path.join(os.path.expanduser("~"), "arxiv_papers.csv"),
+            DEFAULT_CSV_PATH,
             "CSV文件 (*.csv)"
         )
         
         if not file_path:
             return
         
-        try:
-            # 打开文件
-            with open(file_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                
-                # 写入标题行
-                writer.writerow([
-                    "序号", "标题", "作者", "发布日期", "更新日期", "类别", 
-                    "DOI", "期刊引用", "摘要", "arXiv链接", "PDF链接"
-                ])
-                
-                # 写入数据
-                for i, paper in enumerate(self.papers, 1):
-                    authors = ", ".join(paper.get("authors", []))
-                    categories = ", ".join(paper.get("categories", []))
-                    
-                    writer.writerow([
-                        i,
-                        paper.get("title", ""),
-                        authors,
-                        paper.get("published", ""),
-                        paper.get("updated", ""),
-                        categories,
-                        paper.get("doi", "N/A"),
-                        paper.get("journal_ref", "N/A"),
-                        paper.get("summary", "").replace("\n", " "),
-                        paper.get("entry_id", ""),
-                        paper.get("pdf_url", "")
-                    ])
-            
-            self.status_label.setText(f"已保存CSV到: {file_path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"保存文件时出错: {str(e)}")
+        self.start_export(write_csv_file, file_path, "已保存CSV到")
 
     def save_to_text(self):
         """保存结果为文本文件"""
@@ -243,42 +387,35 @@
         # 选择保存文件
         file_path, _ = QFileDialog.getSaveFileName(
             self, "保存文本文件", 
-            os.path.join(os.path.expanduser("~"), "arxiv_papers.txt"),
+            DEFAULT_TEXT_PATH,
             "文本文件 (*.txt)"
         )
         
         if not file_path:
             return
         
-        try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"找到 {len(self.papers)} 篇匹配的论文:\n\n")
-                
-                for i, paper in enumerate(self.papers, 1):
-                    authors = ", ".join(paper.get("authors", []))
-                    categories = ", ".join(paper.get("categories", []))
-                    
-                    f.write(f"{i}. 标题: {paper.get('title', '')}\n")
-                    f.write(f"   作者: {authors}\n")
-                    f.write(f"   发布日期: {paper.get('published', '')}\n")
-                    f.write(f"   更新日期: {paper.get('updated', '')}\n")
-                    f.write(f"   类别: {categories}\n")
-                    
-                    if paper.get("doi") != "N/A":
-                        f.write(f"   DOI: {paper.get('doi', '')}\n")
-                    
-                    if paper.get("journal_ref") != "N/A":
-                        f.write(f"   期刊引用: {paper.get('journal_ref', '')}\n")
-                    
-                    f.write(f"   摘要: {paper.get('summary', '')}\n")
-                    f.write(f"   arXiv链接: {paper.get('entry_id', '')}\n")
-                    f.write(f"   PDF链接: {paper.get('pdf_url', '')}\n")
-                    f.write("-" * 80 + "\n")
-            
-            self.status_label.setText(f"已保存文本到: {file_path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"保存文件时出错: {str(e)}")
+        self.start_export(write_text_file, file_path, "已保存文本到")
+
+    def start_export(self, write_file, file_path, done_text):
+        """在线程池中导出当前结果，完成后在状态栏显示"""
+        task = ExportTask(write_file, file_path, self.papers)
+        task.signals.finished.connect(partial(self.finish_export, task, done_text))
+        task.signals.failed.connect(partial(self.fail_export, task))
+        self.export_tasks.add(task)
+        self.status_label.setText(f"正在保存到: {file_path}")
+        QThreadPool.globalInstance().start(task)
+
+    def finish_export(self, task, done_text, file_path):
+        """导出完成时调用"""
+        self.export_tasks.discard(task)
+        self.status_label.setText(f"{done_text}: {file_path}")
+        # 与README一致弹出提示；使用非模态提示框，不阻塞界面
+        self.show_notice(QMessageBox.Information, "保存成功", f"{done_text}: {file_path}")
+
+    def fail_export(self, task, message):
+        """导出失败时调用"""
+        self.export_tasks.discard(task)
+        QMessageBox.critical(self, "错误", f"保存文件时出错: {message}")
 
     def open_settings(self):
         """
@@ -303,6 +440,10 @@
         if dialog.exec_() == QDialog.Accepted:
             old_direct_arxiv = self.use_direct_arxiv
             old_local_network = self.use_local_network
+            old_config = (self.use_direct_arxiv, self.use_local_network,
+                          self.local_server_url, self.local_api_key,
+                          self.external_server_url, self.external_api_key,
+                          self.server_url, self.api_key)
             
             # 更新主窗口状态
             self.use_direct_arxiv = dialog.use_direct_arxiv()
@@ -315,6 +456,18 @@
             # 设置当前活动的服务器
             self.server_url = dialog.get_active_server_url()
             self.api_key = dialog.get_active_api_key()
+            self.connection_timeout = dialog.connection_timeout()
+            
+            # 配置对话框直接写入了设置，重新记录已保存的值
+            self.cache_settings()
+            
+            # 直接点击确定而没有修改时，不再重复更新界面
+            if old_config == (self.use_direct_arxiv, self.use_local_network,
+                              self.local_server_url, self.local_api_key,
+                              self.external_server_url, self.external_api_key,
+                              self.server_url, self.api_key):
+                self.status_label.setText("配置未变化")
+                return
             
             # 更新UI显示
             self.mode_value.setText("直接访问arXiv" if self.use_direct_arxiv else "服务器模式")
@@ -375,17 +528,16 @@
                         self.external_api_key = new_key
                 
                 # 保存新配置
-                settings = QSettings("arXivSearchClient", "Config")
-                settings.setValue("serverUrl", self.server_url)
-                settings.setValue("apiKey", self.api_key)
+                self.save_setting("serverUrl", self.server_url)
+                self.save_setting("apiKey", self.api_key)
                 
                 if not self.use_direct_arxiv:
                     if self.use_local_network:
-                        settings.setValue("localServerUrl", self.local_server_url)
-                        settings.setValue("localApiKey", self.local_api_key)
+                        self.save_setting("localServerUrl", self.local_server_url)
+                        self.save_setting("localApiKey", self.local_api_key)
                     else:
-                        settings.setValue("externalServerUrl", self.external_server_url)
-                        settings.setValue("externalApiKey", self.external_api_key)
+                        self.save_setting("externalServerUrl", self.external_server_url)
+                        self.save_setting("externalApiKey", self.external_api_key)
                 
                 self.status_label.setText("已更新网络配置")
 
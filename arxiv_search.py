@@ -2,11 +2,146 @@
 # 您已有的代码，但进行了模块化处理
 import arxiv
 import datetime
+import functools
+import hashlib
+import io
+import pickle
+import re
 import time
 import os
+import shutil
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
 
+# 优先使用基于libxml2的lxml流式解析，未安装时退回标准库
+try:
+    from lxml import etree
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    HAVE_LXML = False
+
+# 共享的HTTP会话，保持长连接以复用TCP/TLS连接
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    # 429/503由下载逻辑按Retry-After处理，这里只重试其他临时性服务器错误
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 504])
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+# Atom响应是高度可压缩的XML，明确要求压缩传输（requests会自动解压）
+_SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+
+# 共享的arXiv搜索客户端，在多次搜索之间复用连接
+_CLIENT = arxiv.Client(
+    page_size=100,  # API允许的最大值
+    delay_seconds=3.0,  # 对API友好
+    num_retries=3
+)
+
+# arXiv Atom API地址及XML命名空间
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ATOM_NAMESPACES = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom'
+}
+ATOM_ENTRY_TAG = '{http://www.w3.org/2005/Atom}entry'
+# Atom响应头部给出的总结果数
+TOTAL_RESULTS_RE = re.compile(rb'<opensearch:totalResults[^>]*>(\d+)</opensearch:totalResults>')
+# 每页请求的条目数（API允许的最大值）及翻页间隔（秒）
+API_PAGE_SIZE = 100
+API_PAGE_DELAY = 3.0
+# 返回条目不足一页时重新请求该页的次数
+API_PAGE_RETRIES = 3
+
+# 搜索结果缓存目录及有效期（秒）
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "arxiv-search")
+CACHE_TTL = 3600
+# 磁盘缓存最多保留的文件数，超出时删除最旧的文件
+CACHE_MAX_FILES = 256
+
+# 直接解析Atom响应得到的论文，字段、get_short_id()和download_pdf()与arxiv.Result保持一致
+# authors/categories/links使用元组，缓存的结果被多个调用方共享时不会被修改
+Author = namedtuple("Author", ["name", "affiliation"])
+Link = namedtuple("Link", ["href", "title", "rel", "content_type"])
+
+class Paper(namedtuple("Paper", [
+    "entry_id", "title", "summary", "authors", "published", "updated",
+    "pdf_url", "categories", "primary_category", "doi", "journal_ref",
+    "comment", "links"
+])):
+    """一篇论文（可替代arxiv.Result使用）"""
+    __slots__ = ()
+    
+    def get_short_id(self):
+        """返回arXiv短ID，例如 2107.05580v1"""
+        return self.entry_id.split("arxiv.org/abs/")[-1]
+    
+    def download_pdf(self, dirpath="./", filename=""):
+        """下载PDF到dirpath，返回保存的文件路径"""
+        if not filename:
+            filename = f"{self.get_short_id().replace('/', '_')}.{UNSAFE_FILENAME_RE.sub('_', self.title)}.pdf"
+        filepath = os.path.join(dirpath, filename)
+        _fetch_pdf(self.pdf_url, filepath)
+        return filepath
+
+# 并发下载的线程数
+MAX_DOWNLOAD_WORKERS = 8
+# 生成安全文件名时需要替换的字符（保留字母、数字和 - _ . 空格）
+UNSAFE_FILENAME_RE = re.compile(r"[^\w\-. ]")
+# 写入PDF时每次复制的字节数
+COPY_CHUNK_SIZE = 1 << 18
+# 服务器返回429/503时的最大重试次数
+MAX_RATE_LIMIT_RETRIES = 3
+
+class TokenBucket:
+    """
+    线程安全的令牌桶限速器
+    
+    以rate个/秒的速度补充令牌，最多积累capacity个；
+    只有令牌耗尽时acquire()才会等待。
+    """
+    
+    def __init__(self, rate=3.0, capacity=8):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """取出一个令牌，必要时等待令牌补充"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            
+            wait = 0.0
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+            # 预先扣除令牌（可能为负），让并发的等待者按顺序排队
+            self.tokens -= 1
+        
+        if wait > 0:
+            time.sleep(wait)
+
+# 对arXiv友好 - 持续约3个请求/秒，允许8个突发请求
+_BUCKET = TokenBucket(rate=3.0, capacity=8)
+
+def _retry_after(response, attempt):
+    """根据Retry-After响应头计算重试前的等待秒数，缺失时使用指数退避"""
+    value = response.headers.get("Retry-After", "")
+    if value.isdigit():
+        return int(value)
+    return 2 ** attempt
+
 def construct_query(keywords, search_mode="precise"):
     """
     按照arXiv API语法构造查询字符串
@@ -44,6 +179,292 @@ def construct_query(keywords, search_mode="precise"):
     # 用AND连接所有部分以确保所有关键词都存在
     return " AND ".join(query_parts)
 
+def _entry_text(entry, path, collapse=True):
+    """返回条目中指定元素的文本（默认合并多余空白），不存在时返回None"""
+    element = entry.find(path, ATOM_NAMESPACES)
+    if element is None or not element.text:
+        return None
+    if collapse:
+        return " ".join(element.text.split())
+    return element.text.strip()
+
+def _parse_date(text):
+    """解析Atom中的时间，例如 2023-04-12T12:34:56Z"""
+    return datetime.datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+# 使用lxml时预先编译每个字段的XPath，解析条目时不再重复解析路径
+if HAVE_LXML:
+    _ENTRY_XPATHS = {
+        # smart_strings=False返回普通字符串，不会引用元素树而妨碍流式释放
+        name: etree.XPath(path, namespaces=ATOM_NAMESPACES, smart_strings=False)
+        for name, path in {
+            'entry_id': 'atom:id/text()',
+            'title': 'atom:title/text()',
+            'summary': 'atom:summary/text()',
+            'authors': 'atom:author',
+            'published': 'atom:published/text()',
+            'updated': 'atom:updated/text()',
+            'pdf_url': 'atom:link[@title="pdf"]/@href',
+            'categories': 'atom:category/@term',
+            'primary_category': 'arxiv:primary_category/@term',
+            'doi': 'arxiv:doi/text()',
+            'journal_ref': 'arxiv:journal_ref/text()',
+            'comment': 'arxiv:comment/text()',
+            'links': 'atom:link'
+        }.items()
+    }
+    _AUTHOR_XPATHS = {
+        name: etree.XPath(path, namespaces=ATOM_NAMESPACES, smart_strings=False)
+        for name, path in {
+            'name': 'atom:name/text()',
+            'affiliation': 'arxiv:affiliation/text()'
+        }.items()
+    }
+
+def _parse_link(link):
+    """将<link>元素转换为Link"""
+    return Link(link.get('href'), link.get('title'), link.get('rel'), link.get('type'))
+
+def _first_text(values, collapse=True):
+    """返回XPath结果中的第一个文本（默认合并多余空白），没有结果时返回None"""
+    if not values or not values[0]:
+        return None
+    if collapse:
+        return " ".join(values[0].split())
+    return values[0].strip()
+
+def _parse_entry_xpath(entry):
+    """使用预编译的XPath将一个Atom <entry> 元素转换为Paper"""
+    fields = {name: xpath(entry) for name, xpath in _ENTRY_XPATHS.items()}
+    
+    return Paper(
+        entry_id=_first_text(fields['entry_id']),
+        title=_first_text(fields['title']),
+        summary=_first_text(fields['summary'], collapse=False),
+        authors=tuple(Author(_first_text(_AUTHOR_XPATHS['name'](author)),
+                             _first_text(_AUTHOR_XPATHS['affiliation'](author)))
+                      for author in fields['authors']),
+        published=_parse_date(_first_text(fields['published'])),
+        updated=_parse_date(_first_text(fields['updated'])),
+        pdf_url=fields['pdf_url'][0] if fields['pdf_url'] else None,
+        categories=tuple(fields['categories']),
+        primary_category=fields['primary_category'][0] if fields['primary_category'] else None,
+        doi=_first_text(fields['doi']),
+        journal_ref=_first_text(fields['journal_ref']),
+        comment=_first_text(fields['comment']),
+        links=tuple(_parse_link(link) for link in fields['links'])
+    )
+
+def _parse_entry(entry):
+    """将一个Atom <entry> 元素转换为Paper"""
+    links = tuple(_parse_link(link) for link in entry.findall('atom:link', ATOM_NAMESPACES))
+    pdf_url = next((link.href for link in links if link.title == 'pdf'), None)
+    
+    primary = entry.find('arxiv:primary_category', ATOM_NAMESPACES)
+    
+    return Paper(
+        entry_id=_entry_text(entry, 'atom:id'),
+        title=_entry_text(entry, 'atom:title'),
+        summary=_entry_text(entry, 'atom:summary', collapse=False),
+        authors=tuple(Author(_entry_text(author, 'atom:name'),
+                             _entry_text(author, 'arxiv:affiliation'))
+                      for author in entry.findall('atom:author', ATOM_NAMESPACES)),
+        published=_parse_date(_entry_text(entry, 'atom:published')),
+        updated=_parse_date(_entry_text(entry, 'atom:updated')),
+        pdf_url=pdf_url,
+        categories=tuple(c.get('term') for c in entry.findall('atom:category', ATOM_NAMESPACES)),
+        primary_category=primary.get('term') if primary is not None else None,
+        doi=_entry_text(entry, 'arxiv:doi'),
+        journal_ref=_entry_text(entry, 'arxiv:journal_ref'),
+        comment=_entry_text(entry, 'arxiv:comment'),
+        links=links
+    )
+
+def _iter_entries(data):
+    """流式解析Atom响应，逐个生成<entry>元素，处理完后立即释放"""
+    if HAVE_LXML:
+        events = etree.iterparse(io.BytesIO(data), tag=ATOM_ENTRY_TAG)
+    else:
+        events = etree.iterparse(io.BytesIO(data))
+    
+    for _, element in events:
+        if element.tag != ATOM_ENTRY_TAG:
+            continue
+        yield element
+        element.clear()
+        if HAVE_LXML:
+            # 同时删除已处理的兄弟节点，保持内存占用恒定
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+def _fetch_page(query, start, page_size, delay=0):
+    """请求一页Atom结果（可先等待delay秒），返回响应内容"""
+    if delay:
+        time.sleep(delay)
+    
+    params = {
+        "search_query": query,
+        "start": start,
+        "max_results": page_size,
+        "sortBy": "relevance"
+    }
+    response = _SESSION.get(ARXIV_API_URL, params=params, timeout=(5, 30))
+    response.raise_for_status()
+    return response.content
+
+def _raw_arxiv_search(query, max_results):
+    """
+    直接调用arXiv Atom API分页查询，逐条生成Paper
+    
+    第一页返回总结果数后，由一个后台线程依次请求剩余各页（每页之间等待API_PAGE_DELAY秒），
+    主线程同时解析已经到达的页面，请求间隔不变，但解析不再占用等待时间。
+    arXiv偶尔会返回条目不足甚至为空的页面，此时重新请求该页（最多API_PAGE_RETRIES次），
+    仍然不足时才认为没有更多结果
+    """
+    parse = _parse_entry_xpath if HAVE_LXML else _parse_entry
+    page_size = min(API_PAGE_SIZE, max_results)
+    data = _fetch_page(query, 0, page_size)
+    
+    match = TOTAL_RESULTS_RE.search(data)
+    total = min(int(match.group(1)), max_results) if match else max_results
+    
+    executor = ThreadPoolExecutor(max_workers=1)
+    pages = [(0, page_size, None)]
+    for start in range(page_size, total, API_PAGE_SIZE):
+        size = min(API_PAGE_SIZE, total - start)
+        pages.append((start, size, executor.submit(_fetch_page, query, start, size, API_PAGE_DELAY)))
+    
+    try:
+        for start, requested, future in pages:
+            if future is not None:
+                data = future.result()
+            
+            # 重试时跳过之前已经生成过的条目
+            received = 0
+            for attempt in range(API_PAGE_RETRIES + 1):
+                count = 0
+                for entry in _iter_entries(data):
+                    count += 1
+                    if count > received:
+                        yield parse(entry)
+                received = max(received, count)
+                
+                if received >= requested or attempt == API_PAGE_RETRIES:
+                    break
+                data = _fetch_page(query, start, requested, API_PAGE_DELAY)
+            
+            # 重试后仍然不足一页，说明已经没有更多结果
+            if received < requested:
+                break
+    finally:
+        # 提前结束时取消尚未开始的请求
+        for _, _, future in pages:
+            if future is not None:
+                future.cancel()
+        executor.shutdown(wait=False)
+
+def _paper_from_result(result):
+    """将arxiv.Result转换为Paper，便于缓存"""
+    return Paper(
+        entry_id=result.entry_id,
+        title=result.title,
+        summary=result.summary,
+        authors=tuple(Author(author.name, None) for author in result.authors),
+        published=result.published,
+        updated=result.updated,
+        pdf_url=result.pdf_url,
+        categories=tuple(result.categories),
+        primary_category=result.primary_category,
+        doi=result.doi,
+        journal_ref=result.journal_ref,
+        comment=result.comment,
+        links=tuple(Link(link.href, link.title, link.rel, link.content_type)
+                    for link in result.links)
+    )
+
+def _fetch_results(query, max_results):
+    """从arXiv获取查询结果，直接访问API失败时改用arxiv库"""
+    try:
+        return list(_raw_arxiv_search(query, max_results))
+    except Exception as e:
+        print(f"直接访问arXiv API出错，改用arxiv库: {str(e)}")
+    
+    # 创建搜索
+    search = arxiv.Search(
+        query=query,
+        max_results=max_results,
+        sort_by=arxiv.SortCriterion.Relevance
+    )
+    return [_paper_from_result(result) for result in _CLIENT.results(search)]
+
+def _prune_cache_dir(bucket_start):
+    """删除当前时间段之前写入的缓存文件；剩余文件超过CACHE_MAX_FILES时再删除最旧的"""
+    try:
+        entries = [entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith(".pickle")]
+    except OSError:
+        return
+    
+    files = []
+    for entry in entries:
+        try:
+            files.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            continue
+    files.sort(reverse=True)
+    
+    for i, (mtime, path) in enumerate(files):
+        if mtime < bucket_start or i >= CACHE_MAX_FILES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+@functools.lru_cache(maxsize=32)
+def _cached_search(query, max_results, time_bucket):
+    """
+    带缓存的查询：先查进程内LRU缓存，再查磁盘缓存，都未命中时访问arXiv
+    
+    time_bucket随时间每CACHE_TTL秒变化一次，使进程内缓存按时过期；
+    磁盘缓存只使用同一时间段内写入的文件，因此结果最多保留CACHE_TTL秒。
+    获取失败时抛出异常，不会缓存空结果。
+    """
+    key = hashlib.sha1(repr((query, max_results)).encode()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{key}.pickle")
+    bucket_start = time_bucket * CACHE_TTL
+    
+    # 磁盘缓存（跨进程复用）
+    try:
+        fresh = os.path.getmtime(cache_path) >= bucket_start
+    except OSError:
+        fresh = False
+    if fresh:
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # 文件损坏或Paper字段已变化，删除后重新获取
+            print(f"读取搜索缓存时出错: {str(e)}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+    
+    results = tuple(_fetch_results(query, max_results))
+    
+    # 先写临时文件再替换，避免并发读到不完整的缓存
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"写入搜索缓存时出错: {str(e)}")
+    
+    _prune_cache_dir(bucket_start)
+    
+    return results
+
 def search_arxiv(keywords, start_year=None, end_year=None, max_results=100, search_mode="precise"):
     """
     根据关键词和年份范围在arXiv上搜索论文
@@ -57,7 +478,7 @@ def search_arxiv(keywords, start_year=None, end_year=None, max_results=100, sear
                       或 "fuzzy"(关键词在标题或摘要中)
     
     返回:
-    list: 符合条件的arxiv.Result对象列表
+    list: 符合条件的Paper列表（字段及get_short_id()、download_pdf()与arxiv.Result一致）
     """
     # 使用arXiv语法构造查询
     query = construct_query(keywords, search_mode)
@@ -66,77 +487,96 @@ def search_arxiv(keywords, start_year=None, end_year=None, max_results=100, sear
         print("错误: 未提供有效关键词。")
         return []
     
-    print(f"使用arXiv查询: {query}")
-    
-    # 创建搜索客户端，使用适当参数
-    client = arxiv.Client(
-        page_size=100,  # API允许的最大值
-        delay_seconds=3.0,  # 对API友好
-        num_retries=3
-    )
+    # 年份范围直接交给arXiv过滤，只返回符合条件的论文
+    if start_year or end_year:
+        start_date = f"{start_year}01010000" if start_year else "000101010000"
+        end_date = f"{end_year}12312359" if end_year else "999912312359"
+        query = f"{query} AND submittedDate:[{start_date} TO {end_date}]"
     
-    # 创建搜索
-    search = arxiv.Search(
-        query=query,
-        max_results=max_results,
-        sort_by=arxiv.SortCriterion.Relevance
-    )
+    print(f"使用arXiv查询: {query}")
     
-    # 获取结果
+    # 获取结果（相同查询在CACHE_TTL秒内直接返回缓存）
     print("从arXiv获取数据...")
     try:
-        results = list(client.results(search))
-        print(f"检索到 {len(results)} 篇论文")
+        results = list(_cached_search(query, max_results, int(time.time() // CACHE_TTL)))
     except Exception as e:
         print(f"检索结果时出错: {str(e)}")
         return []
     
-    # 如果指定了年份范围，过滤结果
-    if start_year or end_year:
-        filtered_results = []
-        for paper in results:
-            paper_date = paper.published
-            paper_year = paper_date.year
+    print(f"检索到 {len(results)} 篇论文")
+    
+    return results
+
+def _already_downloaded(filepath):
+    """文件已存在且非空时视为已下载"""
+    return os.path.isfile(filepath) and os.path.getsize(filepath) > 0
+
+def _fetch_pdf(pdf_url, filepath):
+    """下载PDF到filepath，被限流时按Retry-After重试；失败时抛出异常，不留下不完整的文件"""
+    partial_path = f"{filepath}.part"
+    try:
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # 对服务器友好 - 仅在超出速率时等待
+            _BUCKET.acquire()
+            response = _SESSION.get(pdf_url, stream=True, timeout=(5, 30))
             
-            if start_year and paper_year < start_year:
-                continue
-            if end_year and paper_year > end_year:
-                continue
-                
-            filtered_results.append(paper)
+            if response.status_code not in (429, 503) or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            
+            # 被限流，按服务器要求等待后重试
+            response.close()
+            time.sleep(_retry_after(response, attempt))
         
-        print(f"年份过滤后: {len(filtered_results)} 篇论文")
-        return filtered_results
+        with response:
+            response.raise_for_status()
+            
+            # 直接从底层连接按大块复制到文件，由urllib3负责解压
+            response.raw.decode_content = True
+            with open(partial_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=COPY_CHUNK_SIZE)
+        
+        # 下载完整后才改为正式文件名，中断的下载不会被误认为已完成
+        os.replace(partial_path, filepath)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+def _download_one(paper, download_dir):
+    """
+    下载单篇论文PDF（在线程池中执行）
+    """
+    paper_id = paper.entry_id.split('/')[-1]
+    safe_title = UNSAFE_FILENAME_RE.sub("_", paper.title[:50])
+    filename = f"{paper_id}_{safe_title}.pdf"
+    filepath = os.path.join(download_dir, filename)
     
-    return results
+    # 已经下载过的论文直接跳过
+    if _already_downloaded(filepath):
+        return
+    
+    try:
+        _fetch_pdf(paper.pdf_url, filepath)
+    except Exception as e:
+        print(f"下载 {paper.title} 时出错: {str(e)}")
 
-def download_papers(papers, download_dir="arxiv_papers"):
+def download_papers(papers, download_dir="arxiv_papers", max_workers=MAX_DOWNLOAD_WORKERS):
     """
     下载论文PDF
+    
+    参数:
+    papers (list): search_arxiv返回的论文列表
+    download_dir (str): 保存目录
+    max_workers (int): 同时进行的下载数量
     """
     if not os.path.exists(download_dir):
         os.makedirs(download_dir)
     
     print(f"下载 {len(papers)} 篇论文到 {download_dir} 目录")
     
-    for i, paper in enumerate(tqdm(papers, desc="下载论文")):
-        pdf_url = paper.pdf_url
-        paper_id = paper.entry_id.split('/')[-1]
-        safe_title = "".join(c if c.isalnum() else "_" for c in paper.title)[:50]
-        filename = f"{paper_id}_{safe_title}.pdf"
-        filepath = os.path.join(download_dir, filename)
-        
-        try:
-            response = requests.get(pdf_url, stream=True)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            # 对服务器友好 - 添加下载间隔
-            time.sleep(1)
-        except Exception as e:
-            print(f"下载 {paper.title} 时出错: {str(e)}")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_download_one, paper, download_dir) for paper in papers]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="下载论文"):
+            future.result()
 
 # 注意：我们移除了main()函数调用，因为这个文件现在是一个模块
\ No newline at end of file
@@ -11,10 +11,14 @@ import sys
 import os
 import json
 import csv
+import re
 import time
 import urllib.request
 import urllib.parse
-import xml.etree.ElementTree as ET
+import io
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import partial
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QFormLayout, QGroupBox, QLabel, QLineEdit, QComboBox, QSpinBox, 
                            QPushButton, QTableView, QHeaderView, QAbstractItemView, 
@@ -24,10 +28,662 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
                            QCheckBox)
 from PyQt5.QtCore import (Qt, QSettings, QDate, pyqtSlot, QUrl, QAbstractTableModel, 
                         QModelIndex, QVariant, QItemSelectionModel, QTimer, QProcess,
-                        QSortFilterProxyModel)
+                        QSortFilterProxyModel, QEventLoop, QObject, pyqtSignal,
+                        QRunnable, QThreadPool)
 from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PyQt5.QtGui import QIcon, QTextCursor
 
+# 安装了requests时，直接下载通过共享会话复用连接，否则使用urllib
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+# 安装了orjson时用它编解码与服务器交换的JSON，否则使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 安装了numpy时用argsort计算排序排列，否则使用内置sorted
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 优先使用基于libxml2的lxml流式解析，未安装时退回标准库
+try:
+    from lxml import etree
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    HAVE_LXML = False
+
+# 直接从arXiv下载时同时进行的最大请求数（下载线程数）
+MAX_CONCURRENT_DOWNLOADS = 8
+# 单个下载请求无数据传输的超时时间（毫秒）
+DOWNLOAD_TRANSFER_TIMEOUT = 30000
+# 下载线程每次读取并写入的字节数
+DOWNLOAD_CHUNK_SIZE = 1 << 18
+# 通过服务器下载时PDF临时文件的写缓冲区大小（合并readyRead送来的小数据块）
+PDF_WRITE_BUFFER_SIZE = 1 << 18
+# 直接下载共享的HTTP会话（保持长连接），未安装requests时为None
+if requests is not None:
+    DOWNLOAD_SESSION = requests.Session()
+    _adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_CONCURRENT_DOWNLOADS,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 500, 502, 503, 504])
+    )
+    DOWNLOAD_SESSION.mount("https://", _adapter)
+    DOWNLOAD_SESSION.mount("http://", _adapter)
+else:
+    DOWNLOAD_SESSION = None
+# 下载进度对话框的刷新间隔（毫秒）
+PROGRESS_UPDATE_INTERVAL = 100
+# 下载进度对话框的刻度（千分比）
+PROGRESS_SCALE = 1000
+# 结果表格中摘要列显示的最大字符数（完整摘要显示在工具提示中）
+SUMMARY_PREVIEW_LENGTH = 150
+# 结果表格的固定行高（像素）
+TABLE_ROW_HEIGHT = 22
+# 切换排序方式后延迟执行排序的时间（毫秒），用于合并连续的切换操作
+SORT_DEBOUNCE_INTERVAL = 50
+# 网络测试对话框合并输出结果的刷新间隔（毫秒）
+RESULT_FLUSH_INTERVAL = 16
+# 导出CSV/文本时的文件写缓冲区大小
+EXPORT_BUFFER_SIZE = 1 << 20
+# 用户主目录及导出文件的默认路径（只在启动时计算一次）
+HOME_DIR = os.path.expanduser("~")
+DEFAULT_CSV_PATH = os.path.join(HOME_DIR, "arxiv_papers.csv")
+DEFAULT_TEXT_PATH = os.path.join(HOME_DIR, "arxiv_papers.txt")
+# 导出CSV时每批写入文件的行数
+CSV_BATCH_ROWS = 1000
+# 导出文本时每篇论文之后的分隔线
+TEXT_SEPARATOR = "-" * 80 + "\n"
+
+
+# arXiv API查询地址及固定不变的查询参数
+ARXIV_QUERY_URL_PREFIX = ("http://export.arxiv.org/api/query"
+                          "?start=0&sortBy=submittedDate&sortOrder=descending")
+# 每种搜索模式连接关键词的函数：精确模式使用AND，模糊模式使用OR
+ARXIV_QUERY_JOINERS = {"precise": " AND ".join, "fuzzy": " OR ".join}
+# 单个关键词的查询条件格式
+ARXIV_TERM_FORMAT = 'all:"{}"'.format
+
+# arXiv Atom响应中各元素的完整标签名（Clark表示法），查找时无需再解析命名空间前缀
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+ATOM_ENTRY_TAG = ATOM_NS + "entry"
+ATOM_TITLE = ATOM_NS + "title"
+ATOM_SUMMARY = ATOM_NS + "summary"
+ATOM_PUBLISHED = ATOM_NS + "published"
+ATOM_UPDATED = ATOM_NS + "updated"
+ATOM_AUTHOR = ATOM_NS + "author"
+ATOM_NAME = ATOM_NS + "name"
+ATOM_LINK = ATOM_NS + "link"
+ATOM_ID = ATOM_NS + "id"
+ATOM_CATEGORY = ATOM_NS + "category"
+ARXIV_DOI = ARXIV_NS + "doi"
+ARXIV_JOURNAL_REF = ARXIV_NS + "journal_ref"
+
+# 生成安全文件名时需要替换的字符（保留字母、数字和 - _ . 空格）
+UNSAFE_FILENAME_RE = re.compile(r"[^\w\-. ]")
+
+# 一篇论文的数据（比dict更省内存，字段访问也更快）
+# paper_id是从entry_id提取的arXiv ID，解析时计算一次，下载时直接使用
+# authors_text/categories_text是用逗号连接好的作者和类别，表格显示和导出时直接使用
+Paper = namedtuple("Paper", [
+    "title", "authors", "summary", "published", "updated",
+    "entry_id", "paper_id", "pdf_url", "categories", "doi", "journal_ref",
+    "authors_text", "categories_text"
+])
+
+
+def arxiv_id(entry_id):
+    """从entry_id（如 http://arxiv.org/abs/2304.01234v1）提取arXiv ID"""
+    return entry_id.rsplit("/", 1)[-1]
+
+
+def paper_from_dict(data):
+    """将服务器返回的论文字典转换为Paper，缺少的字段使用默认值"""
+    entry_id = data.get("entry_id", "")
+    authors = tuple(data.get("authors", ()))
+    categories = tuple(data.get("categories", ()))
+    return Paper(
+        title=data.get("title", ""),
+        authors=authors,
+        summary=data.get("summary", ""),
+        published=data.get("published", ""),
+        updated=data.get("updated", ""),
+        entry_id=entry_id,
+        paper_id=arxiv_id(entry_id),
+        pdf_url=data.get("pdf_url"),
+        categories=categories,
+        doi=data.get("doi", "N/A"),
+        journal_ref=data.get("journal_ref", "N/A"),
+        authors_text=", ".join(authors),
+        categories_text=", ".join(categories)
+    )
+
+
+# 下载前为每篇论文预先计算的信息
+PaperDescriptor = namedtuple("PaperDescriptor", ["paper_id", "safe_title", "filename"])
+
+
+def paper_descriptor(paper):
+    """取得论文的arXiv ID、安全标题和PDF文件名"""
+    paper_id = paper.paper_id
+    
+    # 创建安全的文件名（只保留部分常见字符，限制文件名长度）
+    safe_title = UNSAFE_FILENAME_RE.sub("_", (paper.title or "论文")[:50])
+    
+    return PaperDescriptor(paper_id, safe_title, f"{paper_id}_{safe_title}.pdf")
+
+
+def finish_partial_file(reply, partial_file, filepath, success):
+    """
+    结束一个边接收边写入的下载。
+    成功时写入剩余数据并将临时文件改为正式文件名，否则删除临时文件。
+    返回是否成功。
+    """
+    if success:
+        partial_file.write(reply.readAll().data())
+    partial_file.close()
+    
+    if success:
+        os.replace(partial_file.name, filepath)
+    else:
+        os.remove(partial_file.name)
+    return success
+
+
+def write_whole_file(filepath, data):
+    """
+    将已完整读入内存的内容写入文件。
+    直接使用os.open/os.write，绕过Python的缓冲写入层；
+    先写入临时文件，成功后再改为正式文件名。
+    """
+    partial_path = f"{filepath}.part"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(partial_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    except OSError:
+        os.close(fd)
+        os.remove(partial_path)
+        raise
+    os.close(fd)
+    os.replace(partial_path, filepath)
+
+
+def iter_atom_entries(xml_data):
+    """流式解析Atom响应，逐个生成<entry>元素，处理完后立即释放"""
+    if HAVE_LXML:
+        events = etree.iterparse(io.BytesIO(xml_data), tag=ATOM_ENTRY_TAG)
+    else:
+        events = etree.iterparse(io.BytesIO(xml_data))
+    
+    for _, element in events:
+        if element.tag != ATOM_ENTRY_TAG:
+            continue
+        yield element
+        element.clear()
+        if HAVE_LXML:
+            # 同时删除已处理的兄弟节点，保持内存占用恒定
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+# 配置统一保存为INI文件：setValue只修改内存，sync()时一次性写入文件
+SETTINGS_ORGANIZATION = "arXivSearchClient"
+SETTINGS_APPLICATION = "Config"
+_SETTINGS_MIGRATED = False
+
+
+def app_settings():
+    """
+    返回INI格式的应用配置。
+    首次调用时如果INI文件还没有内容，则从旧版本使用的系统原生存储（注册表/plist）迁移配置。
+    """
+    global _SETTINGS_MIGRATED
+    settings = QSettings(QSettings.IniFormat, QSettings.UserScope,
+                         SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+    if not _SETTINGS_MIGRATED:
+        _SETTINGS_MIGRATED = True
+        if not settings.allKeys():
+            native = QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+            for key in native.allKeys():
+                settings.setValue(key, native.value(key))
+            settings.sync()
+    return settings
+
+
+# 全局共享的网络管理器，首次使用时创建
+_NETWORK_MANAGER = None
+
+
+def shared_network_manager():
+    """
+    返回整个应用共用的QNetworkAccessManager。
+    主窗口和各对话框共用同一个连接池，长连接、HTTP/2连接和TLS会话可以互相复用。
+    """
+    global _NETWORK_MANAGER
+    if _NETWORK_MANAGER is None:
+        _NETWORK_MANAGER = QNetworkAccessManager(QApplication.instance())
+    return _NETWORK_MANAGER
+
+
+def set_transfer_timeout(request, seconds):
+    """
+    为单个请求设置无数据传输的超时时间（秒），返回该请求。
+    QNetworkRequest.setTransferTimeout需要Qt 5.15以上，旧版本中不设置超时。
+    """
+    if hasattr(request, "setTransferTimeout"):
+        request.setTransferTimeout(int(seconds) * 1000)
+    return request
+
+
+def json_dumps(obj):
+    """将对象编码为UTF-8的JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def json_loads(data):
+    """从JSON字节串解码对象"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def sort_permutation(keys, descending=False):
+    """
+    返回按keys稳定排序后的下标列表，相等的键保持原有顺序（与sorted一致）。
+    安装了numpy时在定长字符串数组上调用argsort，避免逐次比较的Python开销。
+    """
+    if np is None or not keys:
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=descending)
+    
+    if descending:
+        # 对反转后的数组做稳定升序排序再整体反转，保证相等元素仍按原顺序
+        order = np.argsort(np.array(keys[::-1]), kind="stable")[::-1]
+        return (len(keys) - 1 - order).tolist()
+    return np.argsort(np.array(keys), kind="stable").tolist()
+
+
+def parse_entry(entry):
+    """将一个Atom <entry> 元素转换为Paper"""
+    # 解析基本信息
+    title = entry.find(ATOM_TITLE).text.strip()
+    summary = entry.find(ATOM_SUMMARY).text.strip()
+    published = entry.find(ATOM_PUBLISHED).text.strip()
+    updated = entry.find(ATOM_UPDATED).text.strip()
+    
+    # 格式化日期 (从2023-04-12T12:34:56Z 转换为 2023-04-12)
+    published = published.split('T')[0] if 'T' in published else published
+    updated = updated.split('T')[0] if 'T' in updated else updated
+    
+    # 解析作者
+    authors = []
+    for author in entry.findall(ATOM_AUTHOR):
+        name = author.find(ATOM_NAME).text.strip()
+        authors.append(name)
+    
+    # 解析链接
+    links = entry.findall(ATOM_LINK)
+    pdf_url = None
+    for link in links:
+        if link.get('title') == 'pdf' or link.get('type') == 'application/pdf':
+            pdf_url = link.get('href')
+            break
+    
+    # 获取arXiv ID和完整链接
+    id_element = entry.find(ATOM_ID)
+    entry_id = id_element.text if id_element is not None else ""
+    
+    # 解析分类
+    categories = []
+    for category in entry.findall(ATOM_CATEGORY):
+        term = category.get('term')
+        if term:
+            categories.append(term)
+    
+    # 解析arXiv特定字段
+    doi = "N/A"
+    journal_ref = "N/A"
+    
+    doi_element = entry.find(ARXIV_DOI)
+    if doi_element is not None and doi_element.text:
+        doi = doi_element.text.strip()
+    
+    journal_ref_element = entry.find(ARXIV_JOURNAL_REF)
+    if journal_ref_element is not None and journal_ref_element.text:
+        journal_ref = journal_ref_element.text.strip()
+    
+    # 创建论文对象
+    return Paper(
+        title=title,
+        authors=tuple(authors),
+        summary=summary,
+        published=published,
+        updated=updated,
+        entry_id=entry_id,
+        paper_id=arxiv_id(entry_id),
+        pdf_url=pdf_url,
+        categories=tuple(categories),
+        doi=doi,
+        journal_ref=journal_ref,
+        authors_text=", ".join(authors),
+        categories_text=", ".join(categories)
+    )
+
+
+# 使用lxml时预先编译每个字段的XPath，直接得到文本而不必逐个查找子元素
+if HAVE_LXML:
+    ATOM_NAMESPACES = {"atom": ATOM_NS[1:-1], "arxiv": ARXIV_NS[1:-1]}
+    ENTRY_XPATHS = {
+        # smart_strings=False返回普通字符串，不会引用元素树而妨碍流式释放
+        name: etree.XPath(path, namespaces=ATOM_NAMESPACES, smart_strings=False)
+        for name, path in {
+            'title': 'atom:title/text()',
+            'summary': 'atom:summary/text()',
+            'published': 'atom:published/text()',
+            'updated': 'atom:updated/text()',
+            'authors': 'atom:author/atom:name/text()',
+            'pdf_url': 'atom:link[@title="pdf" or @type="application/pdf"]/@href',
+            'entry_id': 'atom:id/text()',
+            'categories': 'atom:category/@term',
+            'doi': 'arxiv:doi/text()',
+            'journal_ref': 'arxiv:journal_ref/text()'
+        }.items()
+    }
+
+
+def first_text(values, default=""):
+    """返回XPath结果中第一个去除首尾空白的文本，没有结果时返回default"""
+    if values:
+        text = values[0].strip()
+        if text:
+            return text
+    return default
+
+
+def parse_entry_xpath(entry):
+    """使用预编译的XPath将一个Atom <entry> 元素转换为Paper"""
+    fields = {name: xpath(entry) for name, xpath in ENTRY_XPATHS.items()}
+    
+    # 格式化日期 (从2023-04-12T12:34:56Z 转换为 2023-04-12)
+    published = first_text(fields['published']).split('T')[0]
+    updated = first_text(fields['updated']).split('T')[0]
+    entry_id = fields['entry_id'][0] if fields['entry_id'] else ""
+    authors = tuple(name.strip() for name in fields['authors'])
+    categories = tuple(term for term in fields['categories'] if term)
+    
+    return Paper(
+        title=first_text(fields['title']),
+        authors=authors,
+        summary=first_text(fields['summary']),
+        published=published,
+        updated=updated,
+        entry_id=entry_id,
+        paper_id=arxiv_id(entry_id),
+        pdf_url=fields['pdf_url'][0] if fields['pdf_url'] else None,
+        categories=categories,
+        doi=first_text(fields['doi'], "N/A"),
+        journal_ref=first_text(fields['journal_ref'], "N/A"),
+        authors_text=", ".join(authors),
+        categories_text=", ".join(categories)
+    )
+
+
+def parse_arxiv_entries(xml_data):
+    """解析arXiv API返回的Atom XML，返回Paper列表（不访问界面，可在工作线程中调用）"""
+    parse = parse_entry_xpath if HAVE_LXML else parse_entry
+    # 流式解析所有条目
+    return [parse(entry) for entry in iter_atom_entries(xml_data)]
+
+
+class XmlParseSignals(QObject):
+    """XML解析任务的信号"""
+    # 参数: 解析得到的论文列表
+    finished = pyqtSignal(list)
+    # 参数: 错误信息
+    failed = pyqtSignal(str)
+
+
+class XmlParseTask(QRunnable):
+    """在线程池中解析arXiv API响应，避免大结果集解析时界面卡顿"""
+    
+    def __init__(self, xml_data):
+        super().__init__()
+        self.xml_data = xml_data
+        self.signals = XmlParseSignals()
+    
+    def run(self):
+        """在工作线程中执行解析"""
+        try:
+            papers = parse_arxiv_entries(self.xml_data)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(papers)
+
+
+class DownloadSignals(QObject):
+    """下载任务的信号（QRunnable不是QObject，不能直接发射信号）"""
+    # 参数: 论文标题, 是否下载成功
+    finished = pyqtSignal(str, bool)
+
+
+class DownloadTask(QRunnable):
+    """
+    在线程池中下载单篇论文PDF的任务。
+    数据边接收边写入临时文件，完整下载后再改为正式文件名；
+    完成后通过signals.finished通知主线程（跨线程信号自动排队）。
+    """
+    
+    def __init__(self, url, filepath, title):
+        super().__init__()
+        self.url = url
+        self.filepath = filepath
+        self.title = title
+        self.canceled = False
+        self.signals = DownloadSignals()
+    
+    def cancel(self):
+        """请求取消下载（下载线程会在读取下一块数据前检查）"""
+        self.canceled = True
+    
+    def run(self):
+        """在工作线程中执行下载"""
+        partial_path = f"{self.filepath}.part"
+        success = False
+        
+        try:
+            if not self.canceled:
+                timeout = DOWNLOAD_TRANSFER_TIMEOUT / 1000
+                if DOWNLOAD_SESSION is not None:
+                    with DOWNLOAD_SESSION.get(self.url, stream=True, timeout=timeout) as response:
+                        response.raise_for_status()
+                        self.write_chunks(response.iter_content(DOWNLOAD_CHUNK_SIZE), partial_path)
+                else:
+                    with urllib.request.urlopen(self.url, timeout=timeout) as response:
+                        chunks = iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b"")
+                        self.write_chunks(chunks, partial_path)
+                
+                if not self.canceled:
+                    os.replace(partial_path, self.filepath)
+                    success = True
+        except Exception as e:
+            print(f"下载错误: {str(e)}")
+        finally:
+            if not success and os.path.exists(partial_path):
+                os.remove(partial_path)
+        
+        self.signals.finished.emit(self.title, success)
+    
+    def write_chunks(self, chunks, partial_path):
+        """将数据块依次写入临时文件，取消时提前停止"""
+        with open(partial_path, "wb") as f:
+            for chunk in chunks:
+                if self.canceled:
+                    break
+                f.write(chunk)
+
+
+class ResponseCheckSignals(QObject):
+    """响应检查任务的信号"""
+    # 参数: 响应长度, <entry>条目数, 响应开头的预览文本
+    finished = pyqtSignal(int, int, str)
+
+
+class ResponseCheckTask(QRunnable):
+    """在线程池中检查arXiv API响应是否为有效的Atom XML，避免在GUI线程扫描和解码"""
+    
+    def __init__(self, data):
+        super().__init__()
+        self.data = data
+        self.signals = ResponseCheckSignals()
+    
+    def run(self):
+        """在工作线程中执行检查"""
+        data = self.data
+        # bytes.count在C层一次扫描完成，先切片再解码预览，避免解码整个响应
+        self.signals.finished.emit(
+            len(data), data.count(b"<entry>"), data[:100].decode(errors="replace")
+        )
+
+
+# 导出时将摘要中的换行替换为空格
+NEWLINE_TO_SPACE = str.maketrans("\r\n", "  ")
+
+
+def csv_rows(papers, start=1):
+    """逐行生成CSV导出数据（序号从start开始）"""
+    for i, paper in enumerate(papers, start):
+        yield (
+            i,
+            paper.title,
+            paper.authors_text,
+            paper.published,
+            paper.updated,
+            paper.categories_text,
+            paper.doi,
+            paper.journal_ref,
+            paper.summary.translate(NEWLINE_TO_SPACE),
+            paper.entry_id,
+            paper.pdf_url
+        )
+
+
+@contextmanager
+def open_export_file(file_path, newline=None):
+    """
+    打开导出文件用于写入。
+    内容先写入临时文件，成功后再改为正式文件名，导出中途出错时不会留下不完整的文件。
+    """
+    partial_path = f"{file_path}.part"
+    f = open(partial_path, "w", newline=newline, encoding="utf-8",
+             buffering=EXPORT_BUFFER_SIZE)
+    try:
+        with f:
+            yield f
+    except BaseException:
+        os.remove(partial_path)
+        raise
+    os.replace(partial_path, file_path)
+
+
+def write_csv_file(file_path, papers):
+    """将论文列表写入CSV文件"""
+    # 先写入内存缓冲区，每CSV_BATCH_ROWS行再写入文件一次，减少文件层的write调用
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    
+    # 写入标题行
+    writer.writerow([
+        "序号", "标题", "作者", "发布日期", "更新日期", "类别", 
+        "DOI", "期刊引用", "摘要", "arXiv链接", "PDF链接"
+    ])
+    
+    with open_export_file(file_path, newline="") as f:
+        # 写入数据
+        for start in range(0, len(papers), CSV_BATCH_ROWS):
+            writer.writerows(csv_rows(papers[start:start + CSV_BATCH_ROWS], start + 1))
+            f.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        
+        # 写入剩余内容（没有论文时只有标题行）
+        f.write(buffer.getvalue())
+
+
+def write_text_file(file_path, papers):
+    """将论文列表写入文本文件"""
+    parts = [f"找到 {len(papers)} 篇匹配的论文:\n\n"]
+    
+    for i, paper in enumerate(papers, 1):
+        parts.append(
+            f"{i}. 标题: {paper.title}\n"
+            f"   作者: {paper.authors_text}\n"
+            f"   发布日期: {paper.published}\n"
+            f"   更新日期: {paper.updated}\n"
+            f"   类别: {paper.categories_text}\n"
+        )
+        
+        if paper.doi != "N/A":
+            parts.append(f"   DOI: {paper.doi}\n")
+        
+        if paper.journal_ref != "N/A":
+            parts.append(f"   期刊引用: {paper.journal_ref}\n")
+        
+        parts.append(
+            f"   摘要: {paper.summary}\n"
+            f"   arXiv链接: {paper.entry_id}\n"
+            f"   PDF链接: {paper.pdf_url or ''}\n{TEXT_SEPARATOR}"
+        )
+    
+    # 拼接成一个字符串后一次性写入（writelines会对每个片段分别调用write）
+    with open_export_file(file_path) as f:
+        f.write("".join(parts))
+
+
+class ExportSignals(QObject):
+    """导出任务的信号"""
+    # 参数: 保存的文件路径
+    finished = pyqtSignal(str)
+    # 参数: 错误信息
+    failed = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """在线程池中导出结果文件，导出大量论文时界面不会卡顿"""
+    
+    def __init__(self, write_file, file_path, papers):
+        super().__init__()
+        self.write_file = write_file
+        self.file_path = file_path
+        # 保存列表的副本，导出期间开始新的搜索也不影响导出内容
+        self.papers = list(papers)
+        self.signals = ExportSignals()
+    
+    def run(self):
+        """在工作线程中写入文件"""
+        try:
+            self.write_file(self.file_path, self.papers)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self.file_path)
+
+
 class PaperModel(QAbstractTableModel):
     """论文数据模型，用于表格视图"""
     
@@ -36,6 +692,36 @@ class PaperModel(QAbstractTableModel):
         # 初始化表头和数据
         self.headers = ["标题", "作者", "发布日期", "类别", "摘要"]
         self.papers = []
+        # 预先计算好的显示列（每列一个列表），data()只做下标访问
+        self.summaries = []
+        self.title_keys = []
+        self.columns = ([], [], [], [], [])
+        self.rank_cache = {}
+    
+    def build_columns(self, first=0):
+        """
+        根据论文列表预先计算各列的显示文本。
+        first之前的行已经计算过，只计算新增的行（作者、类别的拼接字符串在解析时已经生成）。
+        """
+        papers = self.papers[first:]
+        summaries = [p.summary for p in papers]
+        titles = [p.title for p in papers]
+        new_columns = (
+            titles,
+            [p.authors_text for p in papers],
+            [p.published for p in papers],
+            [p.categories_text for p in papers],
+            # 截断过长的摘要
+            [s[:SUMMARY_PREVIEW_LENGTH] + "..." if len(s) > SUMMARY_PREVIEW_LENGTH else s
+             for s in summaries]
+        )
+        
+        self.summaries[first:] = summaries
+        for column, values in zip(self.columns, new_columns):
+            column[first:] = values
+        # 标题排序键只在数据变化时计算一次，重复排序时直接复用
+        self.title_keys[first:] = [title.lower() for title in titles]
+        self.rank_cache = {}
     
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """返回表头数据"""
@@ -60,54 +746,48 @@ class PaperModel(QAbstractTableModel):
         if not index.isValid() or index.row() >= len(self.papers):
             return QVariant()
 
-        paper = self.papers[index.row()]
-        
         if role == Qt.DisplayRole:
-            column = index.column()
-            if column == 0:  # 标题
-                return paper.get("title", "")
-                
-            elif column == 1:  # 作者
-                authors = paper.get("authors", [])
-                return ", ".join(authors)
-                
-            elif column == 2:  # 发布日期
-                return paper.get("published", "")
-                
-            elif column == 3:  # 类别
-                categories = paper.get("categories", [])
-                return ", ".join(categories)
-                
-            elif column == 4:  # 摘要
-                summary = paper.get("summary", "")
-                # 截断过长的摘要
-                if len(summary) > 150:
-                    return summary[:150] + "..."
-                return summary
+            return self.columns[index.column()][index.row()]
         
         # 工具提示显示完整摘要
         if role == Qt.ToolTipRole and index.column() == 4:
-            return paper.get("summary", "")
+            return self.summaries[index.row()]
         
         return QVariant()
     
     def set_papers(self, papers):
         """设置论文数据"""
+        if not self.papers:
+            # 模型为空时按插入行处理，避免视图完全重置
+            self.append_papers(papers)
+            return
         self.beginResetModel()
         self.papers = papers
+        self.build_columns()
         self.endResetModel()
     
+    def append_papers(self, papers):
+        """在末尾追加论文数据"""
+        if not papers:
+            return
+        first = len(self.papers)
+        self.beginInsertRows(QModelIndex(), first, first + len(papers) - 1)
+        self.papers = self.papers + list(papers)
+        self.build_columns(first)
+        self.endInsertRows()
+    
     def clear_papers(self):
         """清除所有论文数据"""
         self.beginResetModel()
         self.papers = []
+        self.build_columns()
         self.endResetModel()
     
     def get_paper(self, row):
         """获取指定行的论文"""
         if 0 <= row < len(self.papers):
             return self.papers[row]
-        return {}
+        return None
     
     def get_all_papers(self):
         """获取所有论文"""
@@ -121,29 +801,42 @@ class PaperModel(QAbstractTableModel):
             return selected_papers
         
         for index in selection_model.selectedRows():
+            # 视图使用排序代理模型时，先映射回源模型中的行
+            if index.model() is not self:
+                index = index.model().mapToSource(index)
             if index.isValid() and index.row() < len(self.papers):
                 selected_papers.append(self.papers[index.row()])
         
         return selected_papers
     
-    def sort_papers(self, column, order=Qt.AscendingOrder):
-        """按照指定列排序论文列表"""
-        self.beginResetModel()
-        
-        if column == 0:  # 按标题排序
-            self.papers = sorted(
-                self.papers, 
-                key=lambda p: p.get("title", "").lower(),
-                reverse=(order == Qt.DescendingOrder)
-            )
-        elif column == 2:  # 按发布日期排序
-            self.papers = sorted(
-                self.papers, 
-                key=lambda p: p.get("published", ""),
-                reverse=(order == Qt.DescendingOrder)
-            )
-        
-        self.endResetModel()
+    def sort_ranks(self, column):
+        """
+        返回指定列每一行的排序名次（相等的键名次相同），用于代理模型比较。
+        名次按列缓存，数据变化时在build_columns中清空。
+        """
+        ranks = self.rank_cache.get(column)
+        if ranks is None:
+            keys = self.title_keys if column == 0 else self.columns[column]
+            ranks = [0] * len(keys)
+            rank = 0
+            for position, row in enumerate(sort_permutation(keys)):
+                if position and keys[row] != keys[previous]:
+                    rank += 1
+                ranks[row] = rank
+                previous = row
+            self.rank_cache[column] = ranks
+        return ranks
+
+
+class PaperSortProxyModel(QSortFilterProxyModel):
+    """
+    论文排序代理模型：在代理中排序，源模型中的论文顺序保持不变。
+    比较时只对比预先计算好的整数名次，不再逐次比较字符串。
+    """
+    
+    def lessThan(self, left, right):
+        ranks = self.sourceModel().sort_ranks(left.column())
+        return ranks[left.row()] < ranks[right.row()]
 
 
 class NetworkTestDialog(QDialog):
@@ -155,9 +848,21 @@ class NetworkTestDialog(QDialog):
         self.resize(500, 400)
         self.setup_ui()
         
-        # 初始化网络管理器
-        self.network_manager = QNetworkAccessManager()
+        # 使用全局共享的网络管理器
+        self.network_manager = shared_network_manager()
         self.ping_process = None
+        self.check_task = None
+        
+        # 对话框内共用一个QSettings，保存的服务器列表只读取一次
+        self.settings = app_settings()
+        self.servers = list(self.settings.value("savedServers", []) or [])
+        
+        # 待显示的测试输出，由定时器合并后一次性写入结果文本框
+        self.pending_results = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(RESULT_FLUSH_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush_results)
         
         # 加载保存的设置
         self.load_servers()
@@ -257,22 +962,21 @@ class NetworkTestDialog(QDialog):
     
     def load_servers(self):
         """加载保存的服务器配置"""
-        settings = QSettings("arXivSearchClient", "Config")
-        
         # 加载当前配置（默认改为示例地址）
-        self.server_url_edit.setText(settings.value("serverUrl", "http://127.0.0.1:5000"))
-        self.api_key_edit.setText(settings.value("apiKey", "your_secret_api_key"))
+        self.server_url_edit.setText(self.settings.value("serverUrl", "http://127.0.0.1:5000"))
+        self.api_key_edit.setText(self.settings.value("apiKey", "your_secret_api_key"))
         
-        # 加载保存的服务器列表
-        servers = settings.value("savedServers", [])
+        self.refresh_server_combo()
+    
+    def refresh_server_combo(self):
+        """根据内存中的服务器列表刷新下拉框"""
         self.server_combo.clear()
         
         # 添加默认选项
         self.server_combo.addItem("-- 选择保存的服务器 --")
         
-        if servers:
-            for server in servers:
-                self.server_combo.addItem(server["name"], server)
+        for server in self.servers:
+            self.server_combo.addItem(server["name"], server)
     
     def on_server_selected(self, index):
         """当选择保存的服务器时更新输入框"""
@@ -303,10 +1007,6 @@ class NetworkTestDialog(QDialog):
         if not ok or not name:
             return
             
-        # 保存到设置
-        settings = QSettings("arXivSearchClient", "Config")
-        servers = settings.value("savedServers", [])
-        
         # 创建新的服务器配置
         new_server = {
             "name": name,
@@ -315,21 +1015,23 @@ class NetworkTestDialog(QDialog):
         }
         
         # 检查是否已存在同名配置
-        for i, server in enumerate(servers):
+        for i, server in enumerate(self.servers):
             if server["name"] == name:
                 # 替换现有配置
-                servers[i] = new_server
-                settings.setValue("savedServers", servers)
-                self.load_servers()
+                self.servers[i] = new_server
+                self.settings.setValue("savedServers", self.servers)
+                self.settings.sync()
+                self.refresh_server_combo()
                 QMessageBox.information(self, "保存成功", f"已更新配置: {name}")
                 return
         
-        # 添加新配置
-        servers.append(new_server)
-        settings.setValue("savedServers", servers)
+        # 添加新配置并保存到设置
+        self.servers.append(new_server)
+        self.settings.setValue("savedServers", self.servers)
+        self.settings.sync()
         
-        # 重新加载列表
-        self.load_servers()
+        # 刷新列表
+        self.refresh_server_combo()
         QMessageBox.information(self, "保存成功", f"已保存配置: {name}")
     
     def delete_selected_server(self):
@@ -353,14 +1055,12 @@ class NetworkTestDialog(QDialog):
             return
             
         # 从设置中删除
-        settings = QSettings("arXivSearchClient", "Config")
-        servers = settings.value("savedServers", [])
-        
-        servers = [s for s in servers if s["name"] != server_name]
-        settings.setValue("savedServers", servers)
+        self.servers = [s for s in self.servers if s["name"] != server_name]
+        self.settings.setValue("savedServers", self.servers)
+        self.settings.sync()
         
-        # 重新加载列表
-        self.load_servers()
+        # 刷新列表
+        self.refresh_server_combo()
         QMessageBox.information(self, "删除成功", f"已删除配置: {server_name}")
     
     def start_test(self):
@@ -372,6 +1072,7 @@ class NetworkTestDialog(QDialog):
             return
             
         # 清除之前的结果
+        self.pending_results.clear()
         self.result_text.clear()
         self.test_button.setEnabled(False)
         self.progress_bar.setValue(0)
@@ -395,7 +1096,7 @@ class NetworkTestDialog(QDialog):
                 if "arxiv.org" in host:
                     self.run_arxiv_api_test()
                 else:
-                    self.run_server_availability_test(url)
+                    self.run_server_availability_test(qurl)
                 
         except Exception as e:
             self.append_result(f"错误: {str(e)}")
@@ -461,6 +1162,7 @@ class NetworkTestDialog(QDialog):
         
         test_url = "http://export.arxiv.org/api/query?search_query=all:electron&start=0&max_results=1"
         request = QNetworkRequest(QUrl(test_url))
+        set_transfer_timeout(request, self.settings.value("connectionTimeout", 30, type=int))
         
         self.append_result(f"测试URL: {test_url}")
         self.progress_bar.setValue(20)
@@ -468,66 +1170,62 @@ class NetworkTestDialog(QDialog):
         # 发送请求
         reply = self.network_manager.get(request)
         
-        # 更新进度条
-        def update_progress():
-            if self.progress_bar.value() < 90:
-                self.progress_bar.setValue(self.progress_bar.value() + 10)
-        
-        timer = QTimer(self)
-        timer.timeout.connect(update_progress)
-        timer.start(300)
+        # 根据实际接收的数据更新进度条
+        reply.downloadProgress.connect(self.update_reply_progress)
         
         def handle_reply():
-            timer.stop()
             self.progress_bar.setValue(100)
             
             if reply.error() == QNetworkReply.NoError:
                 self.append_result("arXiv API连接成功!")
                 
-                # 解析响应
-                data = reply.readAll().data()
-                self.append_result(f"收到响应，长度: {len(data)} 字节")
-                
-                # 检查响应是否包含XML
-                if b"<entry>" in data:
-                    self.append_result("API返回了有效的XML响应，连接测试成功")
-                else:
-                    self.append_result(f"收到非XML响应: {data[:100].decode()}...")
+                # 在线程池中检查响应，结果通过信号回到主线程
+                self.check_task = ResponseCheckTask(reply.readAll().data())
+                self.check_task.signals.finished.connect(self.show_api_check_result)
+                QThreadPool.globalInstance().start(self.check_task)
             else:
                 error_msg = reply.errorString()
                 self.append_result(f"arXiv API连接错误: {error_msg}")
+                self.progress_bar.setVisible(False)
+                self.test_button.setEnabled(True)
             
-            self.progress_bar.setVisible(False)
-            self.test_button.setEnabled(True)
             reply.deleteLater()
         
         reply.finished.connect(handle_reply)
     
-    def run_server_availability_test(self, url):
+    def show_api_check_result(self, length, entry_count, preview):
+        """显示arXiv API响应的检查结果"""
+        self.check_task = None
+        self.append_result(f"收到响应，长度: {length} 字节")
+        
+        # 检查响应是否包含XML
+        if entry_count:
+            self.append_result(f"API返回了有效的XML响应（{entry_count} 个条目），连接测试成功")
+        else:
+            self.append_result(f"收到非XML响应: {preview}...")
+        
+        self.progress_bar.setVisible(False)
+        self.test_button.setEnabled(True)
+    
+    def run_server_availability_test(self, qurl):
         """测试服务器可用性，而不是特定端点"""
         self.append_result("开始测试服务器可用性...")
         
-        # 创建一个基本请求到服务器根路径
-        base_url = url.split('/')[0] + '//' + url.split('/')[2]
-        request = QNetworkRequest(QUrl(base_url))
+        # 创建一个基本请求到服务器根路径（只保留协议和主机部分）
+        base_url = qurl.adjusted(QUrl.RemovePath | QUrl.RemoveQuery | QUrl.RemoveFragment)
+        request = QNetworkRequest(base_url)
+        set_transfer_timeout(request, self.settings.value("connectionTimeout", 30, type=int))
         
-        self.append_result(f"测试URL: {base_url}")
+        self.append_result(f"测试URL: {base_url.toString()}")
         self.progress_bar.setValue(20)
         
         # 发送请求
         reply = self.network_manager.get(request)
         
-        # 更新进度条
-        def update_progress():
-            if self.progress_bar.value() < 90:
-                self.progress_bar.setValue(self.progress_bar.value() + 10)
-        
-        timer = QTimer(self)
-        timer.timeout.connect(update_progress)
-        timer.start(300)
+        # 根据实际接收的数据更新进度条
+        reply.downloadProgress.connect(self.update_reply_progress)
         
         def handle_reply():
-            timer.stop()
             self.progress_bar.setValue(100)
             
             if reply.error() == QNetworkReply.NoError:
@@ -546,13 +1244,31 @@ class NetworkTestDialog(QDialog):
             self.progress_bar.setVisible(False)
             self.test_button.setEnabled(True)
             reply.deleteLater()
+        
+        reply.finished.connect(handle_reply)
+    
+    def update_reply_progress(self, received, total):
+        """根据网络响应的接收进度更新进度条（完成前最多显示到90%）"""
+        if total > 0:
+            self.progress_bar.setValue(max(self.progress_bar.value(), min(90, received * 90 // total)))
+        elif self.progress_bar.value() < 90:
+            # 总长度未知时每收到一批数据前进一点
+            self.progress_bar.setValue(min(90, self.progress_bar.value() + 5))
     
     def append_result(self, text):
-        """向结果文本框添加文本"""
+        """向结果文本框添加文本（先缓存，稍后统一刷新）"""
+        self.pending_results.append(text)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def flush_results(self):
+        """将缓存的输出一次性写入结果文本框"""
+        if not self.pending_results:
+            return
         self.result_text.moveCursor(QTextCursor.End)
-        self.result_text.insertPlainText(text + "\n")
+        self.result_text.insertPlainText("\n".join(self.pending_results) + "\n")
         self.result_text.moveCursor(QTextCursor.End)
-        QApplication.processEvents()  # 更新UI
+        self.pending_results.clear()
     
     def get_server_url(self):
         """获取服务器URL"""
@@ -568,6 +1284,8 @@ class ConfigDialog(QDialog):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 加载和保存配置共用一个QSettings
+        self.settings = app_settings()
         self.setup_ui()
         self.load_settings()
     
@@ -703,7 +1421,7 @@ class ConfigDialog(QDialog):
     
     def load_settings(self):
         """从设置加载配置"""
-        settings = QSettings("arXivSearchClient", "Config")
+        settings = self.settings
         
         # 加载模式设置
         use_direct_arxiv = settings.value("useDirectArxiv", False, type=bool)
@@ -790,7 +1508,7 @@ class ConfigDialog(QDialog):
     def accept(self):
         """确定按钮处理"""
         # 保存设置
-        settings = QSettings("arXivSearchClient", "Config")
+        settings = self.settings
         settings.setValue("useDirectArxiv", self.use_direct_arxiv())
         settings.setValue("useLocalNetwork", self.use_local_network())
         settings.setValue("localServerUrl", self.local_server_url_edit.text())
@@ -802,6 +1520,7 @@ class ConfigDialog(QDialog):
         # 设置当前活动的服务器
         settings.setValue("serverUrl", self.get_active_server_url())
         settings.setValue("apiKey", self.get_active_api_key())
+        settings.sync()
         
         super().accept()
 
@@ -813,10 +1532,30 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         
         # 初始化网络管理器和数据模型
-        self.network_manager = QNetworkAccessManager()
+        self.network_manager = shared_network_manager()
         self.table_model = PaperModel()
+        self.sort_proxy = PaperSortProxyModel(self)
+        self.sort_proxy.setSourceModel(self.table_model)
+        
+        # 直接从arXiv下载PDF使用的线程池，避免下载阻塞界面
+        self.download_pool = QThreadPool(self)
+        self.download_pool.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
         self.papers = []
         
+        # 进行中的搜索请求，以及正在后台解析的arXiv API响应（保留引用直到解析完成）
+        self.search_reply = None
+        self.parse_task = None
+        # 正在后台进行的导出任务
+        self.export_tasks = set()
+        
+        # 服务器请求的模板（包含请求头），在create_request中按需生成
+        self.request_template = None
+        self.request_template_key = None
+        
+        # 主窗口共用一个QSettings，切换模式时只修改内存中的值，退出程序前统一写入文件
+        self.settings = app_settings()
+        QApplication.instance().aboutToQuit.connect(self.settings.sync)
+        
         # 加载配置
         self.load_config()
         
@@ -832,13 +1571,15 @@ class MainWindow(QMainWindow):
     
     def load_config(self):
         """从设置加载配置"""
-        settings = QSettings("arXivSearchClient", "Config")
+        settings = self.settings
         
         # 如果需要配置自己的服务器，请将默认值改为你自己的地址
         self.server_url = settings.value("serverUrl", "http://127.0.0.1:5000")
         self.api_key = settings.value("apiKey", "your_secret_api_key")
         self.use_direct_arxiv = settings.value("useDirectArxiv", False, type=bool)
         self.use_local_network = settings.value("useLocalNetwork", False, type=bool)
+        # 网络请求无数据传输的超时时间（秒），与配置对话框中的“连接超时”一致
+        self.connection_timeout = settings.value("connectionTimeout", 30, type=int)
         
         # 加载详细的网络环境配置
         self.local_server_url = settings.value("localServerUrl", "http://127.0.0.1:5000")
@@ -849,6 +1590,28 @@ class MainWindow(QMainWindow):
         if self.use_direct_arxiv:
             self.server_url = "https://export.arxiv.org/api/query"
             self.api_key = ""
+        
+        self.cache_settings()
+    
+    def cache_settings(self):
+        """记录设置中当前保存的值，供save_setting跳过未变化的写入"""
+        settings = self.settings
+        self.settings_cache = {
+            "useDirectArxiv": settings.value("useDirectArxiv", False, type=bool),
+            "useLocalNetwork": settings.value("useLocalNetwork", False, type=bool),
+            "serverUrl": settings.value("serverUrl"),
+            "apiKey": settings.value("apiKey"),
+            "localServerUrl": settings.value("localServerUrl"),
+            "localApiKey": settings.value("localApiKey"),
+            "externalServerUrl": settings.value("externalServerUrl"),
+            "externalApiKey": settings.value("externalApiKey"),
+        }
+    
+    def save_setting(self, key, value):
+        """仅在值与上次保存的不同时写入设置，来回切换模式时避免重复写盘"""
+        if self.settings_cache.get(key) != value:
+            self.settings.setValue(key, value)
+            self.settings_cache[key] = value
     
     def setup_ui(self):
         """设置用户界面"""
@@ -1010,8 +1773,12 @@ class MainWindow(QMainWindow):
         self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.results_table.setModel(self.table_model)
+        self.results_table.setModel(self.sort_proxy)
         self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # 行高固定、不按内容换行，视图只需查询可见行的数据，不必为测量行高访问所有行
+        self.results_table.setWordWrap(False)
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.results_table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         main_layout.addWidget(self.results_table)
         
         # 操作按钮
@@ -1049,8 +1816,13 @@ class MainWindow(QMainWindow):
         self.settings_button.clicked.connect(self.open_settings)
         self.network_test_button.clicked.connect(self.open_network_test)
         
-        # 排序功能
-        self.sort_combo.currentIndexChanged.connect(self.sort_papers)
+        # 排序功能：连续切换排序方式或顺序时只在最后执行一次排序
+        self.sort_timer = QTimer(self)
+        self.sort_timer.setSingleShot(True)
+        self.sort_timer.setInterval(SORT_DEBOUNCE_INTERVAL)
+        self.sort_timer.timeout.connect(self.sort_papers)
+        # currentIndexChanged带有int参数，直接连接start会调用start(msec)重设间隔，因此丢弃参数
+        self.sort_combo.currentIndexChanged.connect(lambda _index: self.sort_timer.start())
         self.sort_order_button.toggled.connect(self.toggle_sort_order)
         
         # 让回车键触发搜索
@@ -1060,21 +1832,37 @@ class MainWindow(QMainWindow):
         """根据当前排序设置对论文进行排序"""
         sort_column = self.sort_combo.currentData()
         if sort_column is None:
-            return  # 默认排序，不做处理
+            # 默认排序，恢复源模型中的原始顺序
+            self.sort_proxy.sort(-1)
+            return
         
         sort_order = Qt.DescendingOrder if self.sort_order_button.isChecked() else Qt.AscendingOrder
-        self.table_model.sort_papers(sort_column, sort_order)
+        if (self.sort_proxy.sortColumn(), self.sort_proxy.sortOrder()) == (sort_column, sort_order):
+            return  # 已经按此方式排序
+        self.sort_proxy.sort(sort_column, sort_order)
     
     def toggle_sort_order(self, checked):
         """切换排序顺序"""
         self.sort_order_button.setText("↓" if checked else "↑")
         if self.sort_combo.currentData() is not None:
-            self.sort_papers()  # 重新排序
+            self.sort_timer.start()  # 稍后重新排序
+    
+    def cancel_search(self):
+        """中止进行中的搜索，切换模式或网络环境后旧的结果不再需要"""
+        if self.search_reply is not None:
+            self.search_reply.abort()
+        
+        if self.parse_task is not None:
+            # 后台解析无法中断，不再记录它，结果到达时会被丢弃
+            self.parse_task = None
+            self.search_button.setEnabled(True)
     
     def switch_mode(self, use_direct_arxiv):
         """切换运行模式"""
         if self.use_direct_arxiv == use_direct_arxiv:
             return
+        
+        self.cancel_search()
             
         self.use_direct_arxiv = use_direct_arxiv
         
@@ -1102,10 +1890,9 @@ class MainWindow(QMainWindow):
         self.server_url_label.setText(f"服务器: {self.server_url}")
         
         # 保存当前设置
-        settings = QSettings("arXivSearchClient", "Config")
-        settings.setValue("useDirectArxiv", use_direct_arxiv)
-        settings.setValue("serverUrl", self.server_url)
-        settings.setValue("apiKey", self.api_key)
+        self.save_setting("useDirectArxiv", use_direct_arxiv)
+        self.save_setting("serverUrl", self.server_url)
+        self.save_setting("apiKey", self.api_key)
         
         self.status_label.setText(f"已切换到{'直接访问arXiv' if use_direct_arxiv else '服务器'}模式")
     
@@ -1113,6 +1900,8 @@ class MainWindow(QMainWindow):
         """切换网络环境（仅在服务器模式下有效）"""
         if self.use_direct_arxiv or self.use_local_network == use_local_network:
             return
+        
+        self.cancel_search()
             
         self.use_local_network = use_local_network
         
@@ -1131,20 +1920,28 @@ class MainWindow(QMainWindow):
         self.server_url_label.setText(f"服务器: {self.server_url}")
         
         # 保存当前设置
-        settings = QSettings("arXivSearchClient", "Config")
-        settings.setValue("useLocalNetwork", use_local_network)
-        settings.setValue("serverUrl", self.server_url)
-        settings.setValue("apiKey", self.api_key)
+        self.save_setting("useLocalNetwork", use_local_network)
+        self.save_setting("serverUrl", self.server_url)
+        self.save_setting("apiKey", self.api_key)
         
         self.status_label.setText(f"已切换到{'本地' if use_local_network else '外部'}网络环境")
     
     def create_request(self, endpoint):
-        """创建网络请求"""
-        request = QNetworkRequest(QUrl(self.server_url + endpoint))
-        request.setHeader(QNetworkRequest.ContentTypeHeader, "application/json")
-        if self.api_key:
-            request.setRawHeader(b"X-API-Key", self.api_key.encode())
-        return request
+        """创建网络请求（复制预先设置好请求头的模板，只设置URL）"""
+        # API Key变化时才重新生成模板
+        if self.request_template is None or self.request_template_key != self.api_key:
+            template = QNetworkRequest()
+            # QNetworkAccessManager默认复用长连接，服务器支持时再允许HTTP/2多路复用
+            template.setAttribute(QNetworkRequest.HTTP2AllowedAttribute, True)
+            template.setRawHeader(b"Content-Type", b"application/json")
+            if self.api_key:
+                template.setRawHeader(b"X-API-Key", self.api_key.encode())
+            self.request_template = template
+            self.request_template_key = self.api_key
+        
+        request = QNetworkRequest(self.request_template)
+        request.setUrl(QUrl(self.server_url + endpoint))
+        return set_transfer_timeout(request, self.connection_timeout)
     
     def search_papers(self):
         """搜索论文"""
@@ -1182,14 +1979,9 @@ class MainWindow(QMainWindow):
     
     def search_via_arxiv_api(self, keywords, search_mode, start_year, end_year, max_results):
         """通过arXiv官方API搜索"""
-        # 构建查询参数
-        query_terms = keywords.split()
-        if search_mode == "precise":
-            # 精确模式使用AND连接关键词
-            query = " AND ".join([f'all:"{term}"' for term in query_terms])
-        else:
-            # 模糊模式使用OR连接关键词
-            query = " OR ".join([f'all:"{term}"' for term in query_terms])
+        # 构建查询参数（按搜索模式取出预先绑定好的连接函数）
+        join_terms = ARXIV_QUERY_JOINERS.get(search_mode, ARXIV_QUERY_JOINERS["fuzzy"])
+        query = join_terms(map(ARXIV_TERM_FORMAT, keywords.split()))
             
         # 添加年份过滤
         if start_year and end_year:
@@ -1199,137 +1991,69 @@ class MainWindow(QMainWindow):
         elif end_year:
             query += f" AND submittedDate:[00010101 TO {end_year}1231]"
             
-        # 构建API请求URL
-        base_url = "http://export.arxiv.org/api/query"
-        params = {
-            "search_query": query,
-            "start": 0,
-            "max_results": max_results,
-            "sortBy": "submittedDate",
-            "sortOrder": "descending"
-        }
-        query_string = urllib.parse.urlencode(params)
-        request_url = f"{base_url}?{query_string}"
+        # 构建API请求URL（固定参数预先拼好，只需追加结果数和查询条件）
+        request_url = (ARXIV_QUERY_URL_PREFIX + "&max_results=" + str(max_results)
+                       + "&search_query=" + urllib.parse.quote_plus(query))
         
         # 创建请求
         request = QNetworkRequest(QUrl(request_url))
+        request.setAttribute(QNetworkRequest.HTTP2AllowedAttribute, True)
+        set_transfer_timeout(request, self.connection_timeout)
+        # 注意：不要手动设置Accept-Encoding。QNetworkAccessManager会自动请求
+        # gzip/deflate压缩并透明解压，手动设置后反而不会再解压响应
         
         # 发送请求
         reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self.handle_arxiv_api_reply(reply))
+        reply.finished.connect(partial(self.handle_arxiv_api_reply, reply))
+        self.search_reply = reply
     
     def handle_arxiv_api_reply(self, reply):
         """处理arXiv API的响应"""
-        self.search_button.setEnabled(True)
+        self.search_reply = None
         
-        if reply.error() == QNetworkReply.NoError:
-            # 解析XML响应
-            try:
-                data = reply.readAll().data()
-                self.parse_arxiv_api_response(data)
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"解析arXiv API响应时出错: {str(e)}")
-                self.status_label.setText("解析响应失败")
+        if reply.error() == QNetworkReply.OperationCanceledError:
+            # 切换模式时已中止，不再显示错误
+            self.search_button.setEnabled(True)
+        elif reply.error() == QNetworkReply.NoError:
+            # 在线程池中解析XML响应，解析完成后再显示结果并恢复搜索按钮
+            self.status_label.setText("正在解析搜索结果...")
+            task = XmlParseTask(reply.readAll().data())
+            task.signals.finished.connect(partial(self.show_arxiv_api_results, task))
+            task.signals.failed.connect(partial(self.show_arxiv_api_error, task))
+            self.parse_task = task
+            QThreadPool.globalInstance().start(task)
         else:
             # 处理错误
+            self.search_button.setEnabled(True)
             self.handle_network_error(reply.error())
         
         # 释放资源
         reply.deleteLater()
     
-    def parse_arxiv_api_response(self, xml_data):
-        """解析arXiv API返回的XML响应"""
-        try:
-            # 解析XML
-            root = ET.fromstring(xml_data)
-            
-            # 定义命名空间
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
-            
-            # 查找所有条目
-            entries = root.findall('.//atom:entry', namespaces)
-            papers = []
-            
-            for entry in entries:
-                # 解析基本信息
-                title = entry.find('./atom:title', namespaces).text.strip()
-                summary = entry.find('./atom:summary', namespaces).text.strip()
-                published = entry.find('./atom:published', namespaces).text.strip()
-                updated = entry.find('./atom:updated', namespaces).text.strip()
-                
-                # 格式化日期 (从2023-04-12T12:34:56Z 转换为 2023-04-12)
-                published = published.split('T')[0] if 'T' in published else published
-                updated = updated.split('T')[0] if 'T' in updated else updated
-                
-                # 解析作者
-                authors = []
-                for author in entry.findall('./atom:author', namespaces):
-                    name = author.find('./atom:name', namespaces).text.strip()
-                    authors.append(name)
-                
-                # 解析链接
-                links = entry.findall('./atom:link', namespaces)
-                pdf_url = None
-                for link in links:
-                    if link.get('title') == 'pdf' or link.get('type') == 'application/pdf':
-                        pdf_url = link.get('href')
-                        break
-                
-                # 获取arXiv ID和完整链接
-                id_element = entry.find('./atom:id', namespaces)
-                entry_id = id_element.text if id_element is not None else ""
-                
-                # 解析分类
-                categories = []
-                for category in entry.findall('./atom:category', namespaces):
-                    term = category.get('term')
-                    if term:
-                        categories.append(term)
-                
-                # 解析arXiv特定字段
-                doi = "N/A"
-                journal_ref = "N/A"
-                
-                doi_element = entry.find('./arxiv:doi', namespaces)
-                if doi_element is not None and doi_element.text:
-                    doi = doi_element.text.strip()
-                
-                journal_ref_element = entry.find('./arxiv:journal_ref', namespaces)
-                if journal_ref_element is not None and journal_ref_element.text:
-                    journal_ref = journal_ref_element.text.strip()
-                
-                # 创建论文对象
-                paper = {
-                    'title': title,
-                    'authors': authors,
-                    'summary': summary,
-                    'published': published,
-                    'updated': updated,
-                    'entry_id': entry_id,
-                    'pdf_url': pdf_url,
-                    'categories': categories,
-                    'doi': doi,
-                    'journal_ref': journal_ref
-                }
-                
-                papers.append(paper)
-            
-            # 更新UI
-            self.papers = papers
-            self.table_model.set_papers(papers)
-            
-            # 应用当前排序
-            if self.sort_combo.currentData() is not None:
-                self.sort_papers()
-            
-            # 更新状态
-            self.status_label.setText(f"找到 {len(papers)} 篇论文 (arXiv API)")
-            
-        except Exception as e:
-            raise Exception(f"解析XML失败: {str(e)}")
+    def show_arxiv_api_results(self, task, papers):
+        """在主线程中显示后台解析得到的arXiv API结果"""
+        if task is not self.parse_task:
+            # 搜索已被取消，丢弃旧结果
+            return
+        self.parse_task = None
+        self.search_button.setEnabled(True)
+        
+        # 更新UI
+        self.papers = papers
+        # 排序代理模型会按当前排序设置自动排列新数据
+        self.table_model.set_papers(papers)
+        
+        # 更新状态
+        self.status_label.setText(f"找到 {len(papers)} 篇论文 (arXiv API)")
+    
+    def show_arxiv_api_error(self, task, message):
+        """后台解析arXiv API响应失败时调用"""
+        if task is not self.parse_task:
+            return
+        self.parse_task = None
+        self.search_button.setEnabled(True)
+        QMessageBox.critical(self, "错误", f"解析arXiv API响应时出错: 解析XML失败: {message}")
+        self.status_label.setText("解析响应失败")
     
     def search_via_server(self, keywords, search_mode, start_year, end_year, max_results):
         """通过服务器搜索论文（需要你在配置里指定自己的服务器地址）"""
@@ -1348,17 +2072,22 @@ class MainWindow(QMainWindow):
             request_data["end_year"] = end_year
         
         # 转换为JSON
-        json_data = json.dumps(request_data).encode()
+        json_data = json_dumps(request_data)
         
         # 发送请求
         reply = self.network_manager.post(self.create_request("/search"), json_data)
-        reply.finished.connect(lambda: self.handle_search_reply(reply))
+        reply.finished.connect(partial(self.handle_search_reply, reply))
+        self.search_reply = reply
     
     def handle_search_reply(self, reply):
         """处理搜索请求的响应"""
+        self.search_reply = None
         self.search_button.setEnabled(True)
         
-        if reply.error() == QNetworkReply.NoError:
+        if reply.error() == QNetworkReply.OperationCanceledError:
+            # 切换模式时已中止，不再显示错误
+            pass
+        elif reply.error() == QNetworkReply.NoError:
             # 解析响应
             data = reply.readAll().data()
             self.display_results(data)
@@ -1373,7 +2102,7 @@ class MainWindow(QMainWindow):
         """显示搜索结果"""
         try:
             # 解析JSON响应
-            response = json.loads(data.decode())
+            response = json_loads(data)
             
             if not response.get("success", False):
                 QMessageBox.warning(self, "搜索错误", 
@@ -1382,16 +2111,12 @@ class MainWindow(QMainWindow):
                 return
             
             # 处理论文列表
-            papers_data = response.get("papers", [])
+            papers_data = [paper_from_dict(paper) for paper in response.get("papers", [])]
             self.papers = papers_data
             
-            # 更新表格模型
+            # 更新表格模型（排序代理模型会按当前排序设置自动排列新数据）
             self.table_model.set_papers(papers_data)
             
-            # 应用当前排序
-            if self.sort_combo.currentData() is not None:
-                self.sort_papers()
-            
             # 更新状态
             network_type = "本地" if self.use_local_network else "外部"
             self.status_label.setText(f"找到 {len(papers_data)} 篇论文 ({network_type}网络)")
@@ -1431,7 +2156,7 @@ class MainWindow(QMainWindow):
         
         # 选择保存目录
         dir_path = QFileDialog.getExistingDirectory(
-            self, "选择保存目录", os.path.expanduser("~"),
+            self, "选择保存目录", HOME_DIR,
             QFileDialog.ShowDirsOnly
         )
         
@@ -1456,190 +2181,367 @@ class MainWindow(QMainWindow):
             self.download_via_server(selected_papers, dir_path, progress)
     
     def download_from_arxiv(self, selected_papers, dir_path, progress):
-        """直接从arXiv下载论文"""
-        completed = 0
-        
-        for i, paper in enumerate(selected_papers):
-            if progress.wasCanceled():
-                break
-            
-            # 更新进度对话框
-            progress.setValue(i)
-            paper_title = paper.get("title", "论文")
-            progress.setLabelText(f"正在下载 ({i+1}/{len(selected_papers)}): {paper_title}")
-            QApplication.processEvents()
-            
-            # 获取PDF URL
-            pdf_url = paper.get("pdf_url")
+        """直接从arXiv下载论文（在线程池中最多同时下载 MAX_CONCURRENT_DOWNLOADS 篇）"""
+        # 创建下载任务，跳过没有PDF链接和已经下载过的论文
+        self.download_tasks = []
+        already_downloaded = 0
+        for paper in selected_papers:
+            pdf_url = paper.pdf_url
             if not pdf_url:
                 continue
             
-            # 从entry_id提取arxiv ID
-            entry_id = paper.get("entry_id", "")
-            if "/" in entry_id:
-                paper_id = entry_id.split("/")[-1]
-            else:
-                paper_id = entry_id
-            
-            # 创建安全的文件名（只保留部分常见字符）
-            safe_title = "".join(
-                [c if c.isalnum() or c in ['-', '_', '.', ' '] else '_' for c in paper_title]
-            )
-            safe_title = safe_title[:50]  # 限制文件名长度
-            filename = f"{paper_id}_{safe_title}.pdf"
-            filepath = os.path.join(dir_path, filename)
+            filepath = os.path.join(dir_path, paper_descriptor(paper).filename)
+            if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
+                already_downloaded += 1
+                continue
             
-            try:
-                # 发送请求下载PDF
-                request = QNetworkRequest(QUrl(pdf_url))
-                reply = self.network_manager.get(request)
-                
-                # 使用事件循环等待下载完成
-                loop = QTimer()
-                loop.timeout.connect(QApplication.processEvents)
-                loop.start(100)
-                
-                while not reply.isFinished():
-                    QApplication.processEvents()
-                    if progress.wasCanceled():
-                        reply.abort()
-                        break
-                
-                loop.stop()
-                
-                # 保存文件
-                if reply.error() == QNetworkReply.NoError and not progress.wasCanceled():
-                    with open(filepath, "wb") as f:
-                        f.write(reply.readAll().data())
-                    completed += 1
-                
-                reply.deleteLater()
-                
-            except Exception as e:
-                print(f"下载错误: {str(e)}")
+            task = DownloadTask(pdf_url, filepath, paper.title or "论文")
+            task.signals.finished.connect(self.handle_download_finished)
+            self.download_tasks.append(task)
+        
+        # 跳过的论文直接计为已处理，已存在的文件计为下载成功
+        self.download_completed = already_downloaded
+        self.download_pending = len(self.download_tasks)
+        self.download_loop = QEventLoop()
+        
+        progress_timer = self.start_progress_updates(progress, len(selected_papers))
+        self.progress_state["done"] = len(selected_papers) - len(self.download_tasks)
+        
+        progress.canceled.connect(self.cancel_arxiv_downloads)
         
-        progress.setValue(len(selected_papers))
+        for task in self.download_tasks:
+            self.download_pool.start(task)
         
-        # 显示完成信息
+        # 等待所有任务完成（事件循环在最后一个任务结束时退出）
+        if self.download_pending:
+            self.download_loop.exec_()
+        
+        progress.canceled.disconnect(self.cancel_arxiv_downloads)
+        progress_timer.stop()
+        progress_timer.deleteLater()
+        self.download_tasks = []
+        completed = self.download_completed
+        
+        progress.setValue(progress.maximum())
+        
+        # 显示完成信息（非模态，不阻塞后续处理）
         if completed > 0:
-            QMessageBox.information(
-                self, "下载完成", 
+            self.show_notice(
+                QMessageBox.Information, "下载完成", 
                 f"成功下载了 {completed} 篇论文到 {dir_path}"
             )
         else:
-            QMessageBox.warning(
-                self, "下载失败", 
+            self.show_notice(
+                QMessageBox.Warning, "下载失败", 
                 "没有论文被成功下载，请检查网络连接"
             )
         
         self.status_label.setText(f"已下载 {completed} 篇论文")
 
+    def show_notice(self, icon, title, text):
+        """显示非模态提示框，关闭后自动释放"""
+        box = QMessageBox(icon, title, text, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.setWindowModality(Qt.NonModal)
+        box.show()
+
+    def handle_download_finished(self, title, success):
+        """下载线程完成一篇论文时在主线程中调用"""
+        if success:
+            self.download_completed += 1
+        
+        self.download_pending -= 1
+        
+        # 只记录进度，由定时器统一刷新进度对话框
+        self.progress_state["done"] += 1
+        self.progress_state["current"] = title
+        
+        # 全部结束后退出等待循环
+        if self.download_pending == 0:
+            self.download_loop.quit()
+
+    def start_progress_updates(self, progress, total):
+        """
+        启动定时刷新进度对话框的QTimer并返回。
+        下载过程中只修改self.progress_state，对话框每 PROGRESS_UPDATE_INTERVAL 毫秒最多重绘一次。
+        """
+        self.progress_state = {"done": 0, "total": total, "current": ""}
+        
+        # 进度条固定使用千分比刻度，只有刻度变化时才重绘
+        progress.setRange(0, PROGRESS_SCALE)
+        
+        timer = QTimer(self)
+        timer.setInterval(PROGRESS_UPDATE_INTERVAL)
+        timer.timeout.connect(partial(self.refresh_progress, progress))
+        timer.start()
+        return timer
+
+    def refresh_progress(self, progress):
+        """将self.progress_state中的状态刷新到进度对话框（仅在有变化时）"""
+        if progress.wasCanceled():
+            # 取消后对话框已经reset并隐藏，再调用setValue会让它重新显示
+            return
+        
+        state = self.progress_state
+        bucket = state["done"] * PROGRESS_SCALE // max(1, state["total"])
+        if bucket != progress.value():
+            progress.setValue(bucket)
+        
+        label = f"正在下载 ({state['done']}/{state['total']}): {state['current']}"
+        if label != progress.labelText():
+            progress.setLabelText(label)
+
+    def cancel_arxiv_downloads(self):
+        """取消所有排队和进行中的arXiv下载"""
+        for task in self.download_tasks:
+            task.cancel()
+
+    def save_reply(self, reply, filepath):
+        """将已完成的回复内容保存到文件，返回是否成功"""
+        try:
+            write_whole_file(filepath, reply.readAll().data())
+            return True
+        except OSError as e:
+            print(f"下载错误: {str(e)}")
+            return False
+
     def download_via_server(self, selected_papers, dir_path, progress):
         """
-        通过服务器下载选中的论文。
+        通过服务器下载选中的论文（最多同时进行 MAX_CONCURRENT_DOWNLOADS 个请求）。
         如果需要，可在前面 ConfigDialog 或 load_config 方法中配置自己的服务器 URL / 端口 / API Key。
         """
-        completed = 0
+        total = len(selected_papers)
         
-        for i, paper in enumerate(selected_papers):
-            if progress.wasCanceled():
-                break
-            
-            # 从entry_id提取arxiv ID
-            entry_id = paper.get("entry_id", "")
-            if "/" in entry_id:
-                paper_id = entry_id.split("/")[-1]
-            else:
-                paper_id = entry_id
-                
-            paper_title = paper.get("title", "paper")
-            
-            # 更新进度对话框
-            progress.setValue(i)
-            progress.setLabelText(f"正在下载 ({i+1}/{len(selected_papers)}): {paper_title}")
-            QApplication.processEvents()
-            
-            # 准备下载请求
-            request_data = {
-                "paper_id": paper_id,
-                "paper_title": paper_title
-            }
-            
-            json_data = json.dumps(request_data).encode()
-            
-            # 发送请求到服务端 /download 端点
-            # （如果你有自定义下载接口，请在此处修改为对应的路由）
-            reply = self.network_manager.post(self.create_request("/download"), json_data)
-            
-            # 使用“阻塞式”轮询等待本次下载请求完成
-            loop = QTimer()
-            loop.timeout.connect(QApplication.processEvents)
-            loop.start(100)
-            
-            while not reply.isFinished():
-                QApplication.processEvents()
-                if progress.wasCanceled():
-                    reply.abort()
-                    break
-            
-            loop.stop()
-            
-            # 处理响应
-            if reply.error() == QNetworkReply.NoError and not progress.wasCanceled():
-                response_data = json.loads(bytes(reply.readAll()).decode())
-                
-                if response_data.get("success"):
-                    # 获取下载链接
-                    download_link = response_data.get("download_link")
-                    
-                    if download_link:
-                        # 再次向服务器请求 PDF 文件
-                        file_request = self.create_request(download_link)
-                        file_reply = self.network_manager.get(file_request)
-                        
-                        # 等待文件下载完成
-                        loop = QTimer()
-                        loop.timeout.connect(QApplication.processEvents)
-                        loop.start(100)
-                        
-                        while not file_reply.isFinished():
-                            QApplication.processEvents()
-                            if progress.wasCanceled():
-                                file_reply.abort()
-                                break
-                        
-                        loop.stop()
-                        
-                        # 保存文件
-                        if file_reply.error() == QNetworkReply.NoError and not progress.wasCanceled():
-                            filename = download_link.split("/")[-1]
-                            filepath = os.path.join(dir_path, filename)
-                            
-                            with open(filepath, "wb") as f:
-                                f.write(file_reply.readAll().data())
-                            
-                            completed += 1
-                        
-                        file_reply.deleteLater()
-                
-            reply.deleteLater()
+        # 下载前一次性计算所有论文的ID和文件名，倒序存放以便从末尾取出
+        self.server_queue = list(zip(selected_papers, map(paper_descriptor, selected_papers)))[::-1]
+        self.server_replies = set()
+        # 批量请求返回的下载链接（paper_id -> download_link）
+        self.server_links = {}
+        self.server_dir = dir_path
+        self.server_progress = progress
+        self.download_completed = 0
+        self.download_pending = total
+        self.download_loop = QEventLoop()
+        
+        progress_timer = self.start_progress_updates(progress, total)
+        progress.canceled.connect(self.cancel_server_downloads)
+        
+        # 先用一次批量请求取得所有下载链接，回复后再开始并发下载
+        self.request_server_batch()
         
-        progress.setValue(len(selected_papers))
+        # 等待所有下载完成（事件循环在最后一篇结束时退出）
+        if self.download_pending:
+            self.download_loop.exec_()
         
-        # 显示完成信息
+        progress.canceled.disconnect(self.cancel_server_downloads)
+        progress_timer.stop()
+        progress_timer.deleteLater()
+        completed = self.download_completed
+        
+        progress.setValue(progress.maximum())
+        
+        # 显示完成信息（非模态，不阻塞后续处理）
         if completed > 0:
-            QMessageBox.information(
-                self, "下载完成", 
+            self.show_notice(
+                QMessageBox.Information, "下载完成", 
                 f"成功下载了 {completed} 篇论文到 {dir_path}"
             )
         else:
-            QMessageBox.warning(
-                self, "下载失败", 
+            self.show_notice(
+                QMessageBox.Warning, "下载失败", 
                 "没有论文被成功下载，请检查服务器设置和网络连接"
             )
         
         self.status_label.setText(f"已下载 {completed} 篇论文")
 
+    def request_server_batch(self):
+        """向服务器 /download_batch 端点发送一次请求，取得所有排队论文的下载链接"""
+        request_data = {
+            "papers": [
+                {"paper_id": descriptor.paper_id, "paper_title": paper.title or "paper"}
+                for paper, descriptor in reversed(self.server_queue)
+            ]
+        }
+        
+        reply = self.network_manager.post(self.create_request("/download_batch"), json_dumps(request_data))
+        self.server_replies.add(reply)
+        reply.finished.connect(partial(self.handle_server_batch_reply, reply))
+
+    def handle_server_batch_reply(self, reply):
+        """处理/download_batch的回复，然后发出最多 MAX_CONCURRENT_DOWNLOADS 个下载请求"""
+        self.server_replies.discard(reply)
+        reply.deleteLater()
+        
+        response_data = {}
+        if reply.error() == QNetworkReply.NoError:
+            try:
+                response_data = json_loads(bytes(reply.readAll()))
+            except ValueError:
+                pass
+        
+        # 旧版服务器没有该端点（404）或回复格式不符时没有链接，每篇论文仍单独请求/download
+        if response_data.get("success"):
+            self.server_links = {
+                item.get("paper_id"): item.get("download_link")
+                for item in response_data.get("items", [])
+                if item.get("download_link")
+            }
+        
+        # 之后每完成一个再发下一个（已取消时队列为空，不会再发出请求）
+        for _ in range(min(MAX_CONCURRENT_DOWNLOADS, len(self.server_queue))):
+            self.start_next_server_download()
+
+    def start_next_server_download(self):
+        """从队列中取出下一篇论文，向服务器发送下载请求"""
+        if not self.server_queue:
+            return
+        
+        paper, descriptor = self.server_queue.pop()
+        paper_title = paper.title or "paper"
+        
+        # 批量请求已返回下载链接时直接获取PDF
+        download_link = self.server_links.get(descriptor.paper_id)
+        if download_link:
+            self.start_server_file_download(download_link, paper_title)
+            return
+        
+        # 准备下载请求
+        # stream=True请求服务器直接返回PDF内容；旧版服务器会忽略该字段并返回下载链接
+        request_data = {
+            "paper_id": descriptor.paper_id,
+            "paper_title": paper_title,
+            "stream": True
+        }
+        
+        # 发送请求到服务端 /download 端点
+        # （如果你有自定义下载接口，请在此处修改为对应的路由）
+        reply = self.network_manager.post(self.create_request("/download"), json_dumps(request_data))
+        self.server_replies.add(reply)
+        
+        filepath = os.path.join(self.server_dir, descriptor.filename)
+        state = {"file": None}
+        
+        def write_pdf_data():
+            # 服务器直接返回PDF时边接收边写入临时文件；JSON回复留在缓冲区中稍后解析
+            if state["file"] is None:
+                content_type = reply.header(QNetworkRequest.ContentTypeHeader) or ""
+                if not content_type.startswith("application/pdf"):
+                    return
+                try:
+                    state["file"] = open(f"{filepath}.part", "wb", buffering=PDF_WRITE_BUFFER_SIZE)
+                except OSError as e:
+                    print(f"下载错误: {str(e)}")
+                    reply.abort()
+                    return
+            state["file"].write(reply.readAll().data())
+        
+        reply.readyRead.connect(write_pdf_data)
+        reply.finished.connect(
+            lambda: self.handle_server_reply(reply, filepath, paper_title, state["file"])
+        )
+
+    def handle_server_reply(self, reply, filepath, paper_title, partial_file):
+        """处理服务器对/download请求的回复"""
+        self.server_replies.discard(reply)
+        reply.deleteLater()
+        
+        ok = reply.error() == QNetworkReply.NoError and not self.server_progress.wasCanceled()
+        
+        if partial_file is not None:
+            # 服务器已直接返回PDF并写入了临时文件，一次请求完成下载
+            try:
+                success = finish_partial_file(reply, partial_file, filepath, ok)
+            except OSError as e:
+                print(f"下载错误: {str(e)}")
+                success = False
+            self.finish_server_download(paper_title, success)
+            return
+        
+        if not ok:
+            self.finish_server_download(paper_title, False)
+            return
+        
+        content_type = reply.header(QNetworkRequest.ContentTypeHeader) or ""
+        if content_type.startswith("application/pdf"):
+            # 没有触发readyRead（例如空响应体）时一次性保存
+            self.finish_server_download(paper_title, self.save_reply(reply, filepath))
+            return
+        
+        # 获取下载链接，再次向服务器请求 PDF 文件
+        try:
+            response_data = json_loads(bytes(reply.readAll()))
+        except ValueError:
+            response_data = {}
+        download_link = response_data.get("download_link") if response_data.get("success") else None
+        if download_link:
+            self.start_server_file_download(download_link, paper_title)
+        else:
+            self.finish_server_download(paper_title, False)
+
+    def start_server_file_download(self, download_link, paper_title):
+        """按服务器返回的下载链接获取PDF文件"""
+        filename = download_link.split("/")[-1]
+        filepath = os.path.join(self.server_dir, filename)
+        
+        try:
+            # 数据边接收边写入临时文件
+            partial_file = open(f"{filepath}.part", "wb", buffering=PDF_WRITE_BUFFER_SIZE)
+        except OSError as e:
+            print(f"下载错误: {str(e)}")
+            self.finish_server_download(paper_title, False)
+            return
+        
+        file_reply = self.network_manager.get(self.create_request(download_link))
+        self.server_replies.add(file_reply)
+        file_reply.readyRead.connect(lambda: partial_file.write(file_reply.readAll().data()))
+        
+        def handle_file_reply():
+            self.server_replies.discard(file_reply)
+            file_reply.deleteLater()
+            
+            # 保存文件
+            try:
+                success = (file_reply.error() == QNetworkReply.NoError
+                           and not self.server_progress.wasCanceled())
+                success = finish_partial_file(file_reply, partial_file, filepath, success)
+            except OSError as e:
+                print(f"下载错误: {str(e)}")
+                success = False
+            self.finish_server_download(paper_title, success)
+        
+        file_reply.finished.connect(handle_file_reply)
+
+    def finish_server_download(self, paper_title, success):
+        """一篇论文通过服务器下载结束（成功或失败）时调用"""
+        if success:
+            self.download_completed += 1
+        
+        self.download_pending -= 1
+        
+        # 只记录进度，由定时器统一刷新进度对话框
+        self.progress_state["done"] += 1
+        self.progress_state["current"] = paper_title
+        
+        self.start_next_server_download()
+        
+        # 全部结束后退出等待循环
+        if self.download_pending == 0:
+            self.download_loop.quit()
+
+    def cancel_server_downloads(self):
+        """取消所有排队和进行中的服务器下载"""
+        # 排队中的论文直接计为已处理
+        self.download_pending -= len(self.server_queue)
+        self.progress_state["done"] += len(self.server_queue)
+        self.server_queue = []
+        
+        # 中止进行中的请求，它们的finished处理函数会把各自计为失败
+        for reply in list(self.server_replies):
+            reply.abort()
+        
+        if self.download_pending == 0:
+            self.download_loop.quit()
+
     def save_to_csv(self):
         """保存结果为CSV文件"""
         if not self.papers:
@@ -1649,47 +2551,14 @@ class MainWindow(QMainWindow):
         # 选择保存文件
         file_path, _ = QFileDialog.getSaveFileName(
             self, "保存CSV文件", 
-            os.path.join(os.path.expanduser("~"), "arxiv_papers.csv"),
+            DEFAULT_CSV_PATH,
             "CSV文件 (*.csv)"
         )
         
         if not file_path:
             return
         
-        try:
-            # 打开文件
-            with open(file_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                
-                # 写入标题行
-                writer.writerow([
-                    "序号", "标题", "作者", "发布日期", "更新日期", "类别", 
-                    "DOI", "期刊引用", "摘要", "arXiv链接", "PDF链接"
-                ])
-                
-                # 写入数据
-                for i, paper in enumerate(self.papers, 1):
-                    authors = ", ".join(paper.get("authors", []))
-                    categories = ", ".join(paper.get("categories", []))
-                    
-                    writer.writerow([
-                        i,
-                        paper.get("title", ""),
-                        authors,
-                        paper.get("published", ""),
-                        paper.get("updated", ""),
-                        categories,
-                        paper.get("doi", "N/A"),
-                        paper.get("journal_ref", "N/A"),
-                        paper.get("summary", "").replace("\n", " "),
-                        paper.get("entry_id", ""),
-                        paper.get("pdf_url", "")
-                    ])
-            
-            self.status_label.setText(f"已保存CSV到: {file_path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"保存文件时出错: {str(e)}")
+        self.start_export(write_csv_file, file_path, "已保存CSV到")
 
     def save_to_text(self):
         """保存结果为文本文件"""
@@ -1700,42 +2569,35 @@ class MainWindow(QMainWindow):
         # 选择保存文件
         file_path, _ = QFileDialog.getSaveFileName(
             self, "保存文本文件", 
-            os.path.join(os.path.expanduser("~"), "arxiv_papers.txt"),
+            DEFAULT_TEXT_PATH,
             "文本文件 (*.txt)"
         )
         
         if not file_path:
             return
         
-        try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"找到 {len(self.papers)} 篇匹配的论文:\n\n")
-                
-                for i, paper in enumerate(self.papers, 1):
-                    authors = ", ".join(paper.get("authors", []))
-                    categories = ", ".join(paper.get("categories", []))
-                    
-                    f.write(f"{i}. 标题: {paper.get('title', '')}\n")
-                    f.write(f"   作者: {authors}\n")
-                    f.write(f"   发布日期: {paper.get('published', '')}\n")
-                    f.write(f"   更新日期: {paper.get('updated', '')}\n")
-                    f.write(f"   类别: {categories}\n")
-                    
-                    if paper.get("doi") != "N/A":
-                        f.write(f"   DOI: {paper.get('doi', '')}\n")
-                    
-                    if paper.get("journal_ref") != "N/A":
-                        f.write(f"   期刊引用: {paper.get('journal_ref', '')}\n")
-                    
-                    f.write(f"   摘要: {paper.get('summary', '')}\n")
-                    f.write(f"   arXiv链接: {paper.get('entry_id', '')}\n")
-                    f.write(f"   PDF链接: {paper.get('pdf_url', '')}\n")
-                    f.write("-" * 80 + "\n")
-            
-            self.status_label.setText(f"已保存文本到: {file_path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"保存文件时出错: {str(e)}")
+        self.start_export(write_text_file, file_path, "已保存文本到")
+
+    def start_export(self, write_file, file_path, done_text):
+        """在线程池中导出当前结果，完成后在状态栏显示"""
+        task = ExportTask(write_file, file_path, self.papers)
+        task.signals.finished.connect(partial(self.finish_export, task, done_text))
+        task.signals.failed.connect(partial(self.fail_export, task))
+        self.export_tasks.add(task)
+        self.status_label.setText(f"正在保存到: {file_path}")
+        QThreadPool.globalInstance().start(task)
+
+    def finish_export(self, task, done_text, file_path):
+        """导出完成时调用"""
+        self.export_tasks.discard(task)
+        self.status_label.setText(f"{done_text}: {file_path}")
+        # 与README一致弹出提示；使用非模态提示框，不阻塞界面
+        self.show_notice(QMessageBox.Information, "保存成功", f"{done_text}: {file_path}")
+
+    def fail_export(self, task, message):
+        """导出失败时调用"""
+        self.export_tasks.discard(task)
+        QMessageBox.critical(self, "错误", f"保存文件时出错: {message}")
 
     def open_settings(self):
         """
@@ -1760,6 +2622,10 @@ class MainWindow(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             old_direct_arxiv = self.use_direct_arxiv
             old_local_network = self.use_local_network
+            old_config = (self.use_direct_arxiv, self.use_local_network,
+                          self.local_server_url, self.local_api_key,
+                          self.external_server_url, self.external_api_key,
+                          self.server_url, self.api_key)
             
             # 更新主窗口状态
             self.use_direct_arxiv = dialog.use_direct_arxiv()
@@ -1772,6 +2638,18 @@ class MainWindow(QMainWindow):
             # 设置当前活动的服务器
             self.server_url = dialog.get_active_server_url()
             self.api_key = dialog.get_active_api_key()
+            self.connection_timeout = dialog.connection_timeout()
+            
+            # 配置对话框直接写入了设置，重新记录已保存的值
+            self.cache_settings()
+            
+            # 直接点击确定而没有修改时，不再重复更新界面
+            if old_config == (self.use_direct_arxiv, self.use_local_network,
+                              self.local_server_url, self.local_api_key,
+                              self.external_server_url, self.external_api_key,
+                              self.server_url, self.api_key):
+                self.status_label.setText("配置未变化")
+                return
             
             # 更新UI显示
             self.mode_value.setText("直接访问arXiv" if self.use_direct_arxiv else "服务器模式")
@@ -1832,17 +2710,16 @@ class MainWindow(QMainWindow):
                         self.external_api_key = new_key
                 
                 # 保存新配置
-                settings = QSettings("arXivSearchClient", "Config")
-                settings.setValue("serverUrl", self.server_url)
-                settings.setValue("apiKey", self.api_key)
+                self.save_setting("serverUrl", self.server_url)
+                self.save_setting("apiKey", self.api_key)
                 
                 if not self.use_direct_arxiv:
                     if self.use_local_network:
-                        settings.setValue("localServerUrl", self.local_server_url)
-                        settings.setValue("localApiKey", self.local_api_key)
+                        self.save_setting("localServerUrl", self.local_server_url)
+                        self.save_setting("localApiKey", self.local_api_key)
                     else:
-                        settings.setValue("externalServerUrl", self.external_server_url)
-                        settings.setValue("externalApiKey", self.external_api_key)
+                        self.save_setting("externalServerUrl", self.external_server_url)
+                        self.save_setting("externalApiKey", self.external_api_key)
                 
                 self.status_label.setText("已更新网络配置")
 
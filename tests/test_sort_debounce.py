@@ -0,0 +1,35 @@
+# 需要PyQt5：使用offscreen平台，无显示器的环境（如CI）中也能运行；未安装PyQt5时整个文件跳过
+import os
+import sys
+
+import pytest
+
+# 无显示环境下也能创建窗口
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtCore import QSettings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import client
+
+
+@pytest.fixture
+def window(tmp_path):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    # 配置写入临时目录，不影响用户自己的设置
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, str(tmp_path))
+    QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, str(tmp_path))
+    win = client.MainWindow()
+    yield win
+    win.close()
+    win.deleteLater()
+    app.processEvents()
+
+
+def test_sort_combo_change_keeps_debounce_interval(window):
+    for index in range(window.sort_combo.count()):
+        window.sort_combo.setCurrentIndex(index)
+        assert window.sort_timer.interval() == client.SORT_DEBOUNCE_INTERVAL
+    window.sort_combo.setCurrentIndex(0)
+    assert window.sort_timer.interval() == client.SORT_DEBOUNCE_INTERVAL